@@ -0,0 +1,82 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains background writer tests for tpDcc-libs-datalibrary
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import subprocess
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.datalibrary.core import asyncwriter
+
+
+class TestAsyncWriter(unittestcase.UnitTestCase()):
+    def __init__(self, *args, **kwargs):
+        super(TestAsyncWriter, self).__init__(*args, **kwargs)
+
+    def setUp(self):
+        super(TestAsyncWriter, self).setUp()
+
+        self._data_folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        super(TestAsyncWriter, self).tearDown()
+
+        shutil.rmtree(self._data_folder)
+
+    def test_enqueue_and_flush(self):
+        calls = list()
+
+        def _callback():
+            calls.append(threading.current_thread())
+
+        writer = asyncwriter.AsyncArtifactWriter(flush_count=100, flush_interval=100.0)
+        file_path = os.path.join(self._data_folder, 'sub', 'data.txt')
+        empty_path = os.path.join(self._data_folder, 'empty.txt')
+        writer.enqueue(file_path, b'data', callback=_callback)
+        writer.enqueue(empty_path, callback=_callback)
+        writer.flush()
+
+        with open(file_path, 'rb') as fh:
+            self.assertEqual(fh.read(), b'data')
+        self.assertTrue(os.path.isfile(empty_path))
+
+        # Batched callbacks are called once and always from the thread that flushes
+        self.assertEqual(calls, [threading.current_thread()])
+
+    def test_enqueue_runs_ready_callbacks(self):
+        calls = list()
+        writer = asyncwriter.AsyncArtifactWriter(flush_count=1, flush_interval=100.0)
+        writer.enqueue(os.path.join(self._data_folder, 'a.txt'), b'a', callback=lambda: calls.append('a'))
+        writer._queue.join()
+        writer.enqueue(os.path.join(self._data_folder, 'b.txt'), b'b', callback=lambda: calls.append('b'))
+
+        self.assertEqual(calls, ['a'])
+
+        writer.flush()
+
+        self.assertEqual(calls, ['a', 'b'])
+
+    def test_flush_without_writes(self):
+        writer = asyncwriter.AsyncArtifactWriter()
+        writer.flush()
+
+    def test_flush_at_exit(self):
+        file_path = os.path.join(self._data_folder, 'exit.txt')
+        script = (
+            'from tpDcc.libs.datalibrary.core import asyncwriter\n'
+            'asyncwriter.WRITER.enqueue({!r}, b"exit", callback=lambda: print("synced"))\n'.format(file_path))
+        output = subprocess.check_output([sys.executable, '-c', script])
+
+        with open(file_path, 'rb') as fh:
+            self.assertEqual(fh.read(), b'exit')
+        self.assertEqual(output.strip(), b'synced')
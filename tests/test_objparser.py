@@ -0,0 +1,90 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains OBJ parser tests for tpDcc-libs-datalibrary
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import shutil
+import tempfile
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.datalibrary.core import objparser
+
+
+OBJ_CONTENTS = """# test quad
+v 0.0 0.0 0.0
+v 1.0 0.0 0.0
+v 0.0 1.0 0.0
+v 1.0 1.0 0.0
+vn 0.0 0.0 1.0
+f 1 2 3
+f 2/1/1 4/2/1 -2/3/1 1//1
+"""
+
+
+class TestObjParser(unittestcase.UnitTestCase()):
+    def __init__(self, *args, **kwargs):
+        super(TestObjParser, self).__init__(*args, **kwargs)
+
+    def setUp(self):
+        super(TestObjParser, self).setUp()
+
+        self._data_folder = tempfile.mkdtemp()
+        self._obj_path = os.path.join(self._data_folder, 'quad.obj')
+        with open(self._obj_path, 'w') as fh:
+            fh.write(OBJ_CONTENTS)
+
+    def tearDown(self):
+        super(TestObjParser, self).tearDown()
+
+        shutil.rmtree(self._data_folder)
+
+    def test_scan_counts(self):
+        self.assertEqual(objparser.scan_counts(self._obj_path), (4, 2, 7))
+
+    def test_read(self):
+        coords, indices, face_sizes = objparser.read(self._obj_path)
+
+        self.assertEqual(len(coords), 12)
+        self.assertEqual(list(coords[9:12]), [1.0, 1.0, 0.0])
+        self.assertEqual(list(indices), [0, 1, 2, 1, 3, 2, 0])
+        self.assertEqual(list(face_sizes), [3, 4])
+
+    def test_empty_file(self):
+        empty_path = os.path.join(self._data_folder, 'empty.obj')
+        open(empty_path, 'w').close()
+
+        coords, indices, face_sizes = objparser.read(empty_path)
+
+        self.assertEqual(len(coords), 0)
+        self.assertEqual(len(indices), 0)
+        self.assertEqual(len(face_sizes), 0)
+
+    def test_tab_separated_keywords(self):
+        tabs_path = os.path.join(self._data_folder, 'tabs.obj')
+        with open(tabs_path, 'w') as fh:
+            fh.write('v\t0.0 0.0 0.0\nv\t1.0 0.0 0.0\nv 0.0 1.0 0.0\nf\t1 2 3\n')
+
+        self.assertEqual(objparser.scan_counts(tabs_path), (3, 1, 3))
+
+        coords, indices, face_sizes = objparser.read(tabs_path)
+
+        self.assertEqual(list(coords[3:6]), [1.0, 0.0, 0.0])
+        self.assertEqual(list(indices), [0, 1, 2])
+        self.assertEqual(list(face_sizes), [3])
+
+    def test_short_vertex_lines(self):
+        short_path = os.path.join(self._data_folder, 'short.obj')
+        with open(short_path, 'w') as fh:
+            fh.write('v 1.0\nv\nv 1.0 2.0 3.0\nf 1 2 3\n')
+
+        coords, indices, face_sizes = objparser.read(short_path)
+
+        self.assertEqual(list(coords), [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 3.0])
+        self.assertEqual(list(indices), [0, 1, 2])
+        self.assertEqual(list(face_sizes), [3])
@@ -0,0 +1,146 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a background writer used to flush non critical data files without blocking the caller
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import time
+import atexit
+import logging
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from tpDcc.libs.datalibrary.core import consts
+
+logger = logging.getLogger(consts.LIB_ID)
+
+
+class AsyncArtifactWriter(object):
+    """
+    Writes files in a background thread. Callbacks registered with the writes (for example, data library syncs) are
+    batched and never called from the writer thread: each unique callback is called from the caller thread, either by
+    flush or by the next enqueue once flush_count writes were done or flush_interval seconds passed
+    """
+
+    def __init__(self, flush_count=32, flush_interval=2.0):
+        self._queue = queue.Queue()
+        self._flush_count = flush_count
+        self._flush_interval = flush_interval
+        self._callbacks = list()
+        self._pending = 0
+        self._last_flush = time.time()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    # ============================================================================================================
+    # BASE
+    # ============================================================================================================
+
+    def enqueue(self, path, payload=None, callback=None):
+        """
+        Adds a new write operation to the queue
+        :param path: str, file path to write into
+        :param payload: bytes or None, contents to write. If None, file is only created if it does not exist
+        :param callback: callable or None, function to call once the write has been flushed
+        """
+
+        self._start()
+        self._queue.put((path, payload, callback))
+
+        with self._lock:
+            ready = self._pending >= self._flush_count or (
+                self._pending and time.time() - self._last_flush >= self._flush_interval)
+        if ready:
+            self._run_callbacks()
+
+    def flush(self):
+        """
+        Blocks until all the queued writes are written into disk and calls their callbacks from the caller thread
+        """
+
+        if self._thread is None:
+            return
+
+        self._queue.join()
+        self._run_callbacks()
+
+    # ============================================================================================================
+    # INTERNAL
+    # ============================================================================================================
+
+    def _start(self):
+        """
+        Internal function that starts the writer thread if it is not already running
+        """
+
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='AsyncArtifactWriter')
+            self._thread.daemon = True
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _run(self):
+        """
+        Internal function that drains the writes queue
+        """
+
+        while True:
+            path, payload, callback = self._queue.get()
+            try:
+                self._write(path, payload)
+                with self._lock:
+                    if callback is not None and callback not in self._callbacks:
+                        self._callbacks.append(callback)
+                    self._pending += 1
+            except Exception as exc:
+                logger.warning('Error while writing file "{}" | {}'.format(path, exc))
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path, payload):
+        """
+        Internal function that writes the given payload into the given path
+        :param path: str
+        :param payload: bytes or None
+        """
+
+        dirname = os.path.dirname(path)
+        if dirname and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+
+        if payload is None:
+            with open(path, 'ab'):
+                pass
+        else:
+            with open(path, 'wb') as fh:
+                fh.write(payload)
+
+    def _run_callbacks(self):
+        """
+        Internal function that calls all batched callbacks. Must be called from the caller thread
+        """
+
+        with self._lock:
+            callbacks = self._callbacks
+            self._callbacks = list()
+            self._pending = 0
+            self._last_flush = time.time()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as exc:
+                logger.warning('Error while executing writer callback {} | {}'.format(callback, exc))
+
+
+# Shared writer used by data parts that do not need their writes to be available immediately
+WRITER = AsyncArtifactWriter()
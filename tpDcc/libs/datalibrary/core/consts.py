@@ -8,3 +8,6 @@ Module that contains consts definitions used by data library library
 LIB_ID = 'tpDcc-libs-datalibrary'
 
 DEFAULT_LIBRARY_NAME = 'Default'
+
+# Maximum number of threads used to extract data fields during library scans
+SCAN_THREADS = 8
@@ -9,6 +9,7 @@ import getpass
 import sqlite3
 import logging
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 import shortuuid
 
@@ -607,6 +608,7 @@ class DataLibrary(object):
                 for scan_plugin in self._scan_factory.plugins():
                     if not scan_plugin.can_represent(location):
                         continue
+                    identifiers = list()
                     for identifier in scan_plugin.identifiers(location, skip_regex, recursive=recursive):
 
                         if identifier == location:
@@ -617,9 +619,12 @@ class DataLibrary(object):
                             blacklisted_identifiers.append(identifier)
                             continue
 
+                        identifiers.append(identifier)
+
+                    all_scanned_fields = self._scan_fields(scan_plugin, identifiers)
+                    for identifier, scanned_fields in zip(identifiers, all_scanned_fields):
                         field_values = list()
                         relative_identifier = self._get_relative_identifier(identifier)
-                        scanned_fields = scan_plugin.fields(identifier)
                         self._update_fields(identifier, scanned_fields)
                         for field_name in field_names:
                             field_values.append('' if field_name not in scanned_fields else scanned_fields[field_name])
@@ -2015,6 +2020,25 @@ class DataLibrary(object):
 
             self.register_data_class(item_class_name, 'tpDcc')
 
+    def _scan_fields(self, scan_plugin, identifiers):
+        """
+        Internal function that returns the fields of the given identifiers using the given scan plugin.
+        Fields extraction is I/O bound (stat calls mostly), so it is done in a pool of threads
+        :param scan_plugin: BaseScanner
+        :param identifiers: list(str)
+        :return: list(dict)
+        """
+
+        if len(identifiers) < 2:
+            return [scan_plugin.fields(identifier) for identifier in identifiers]
+
+        pool = ThreadPool(min(consts.SCAN_THREADS, len(identifiers)))
+        try:
+            return pool.map(scan_plugin.fields, identifiers)
+        finally:
+            pool.close()
+            pool.join()
+
     def _update_fields(self, identifier, scanned_fields):
         """
         Internal function that updates the scanned fields returned by the scan plugin
@@ -51,6 +51,8 @@ class DataPart(composition.Composition):
         if self.extension() and not self._id.endswith(self.extension()):
             self._id = '{}{}'.format(self._id, self.extension())
 
+        self._basename = None
+
     def __repr__(self):
         base_repr = super(DataPart, self).__repr__()
         return base_repr.replace('DataPart', 'DataPart: {}'.format(self._id))
@@ -87,12 +89,14 @@ class DataPart(composition.Composition):
     @classmethod
     def supported_dccs(cls):
         """
-        Returns a list of DCC names this data can be loaded into. In a situation where multiple DataParts are bound
+        Returns a tuple of DCC names this data can be loaded into. In a situation where multiple DataParts are bound
         then the combined results of all the mandatory tags are used.
-        :return: list(str) or None
+        NOTE: This is called a lot while filtering data, so return an immutable constant instead of building a
+        new container each call
+        :return: tuple(str) or None
         """
 
-        return list()
+        return tuple()
 
     @decorators.first_true
     def type(self):
@@ -234,6 +238,18 @@ class DataPart(composition.Composition):
 
         return self._id
 
+    def basename(self):
+        """
+        Returns the base name of the identifier of this data part.
+        Value is cached because it is queried each time data part label is drawn
+        :return: str
+        """
+
+        if self._basename is None:
+            self._basename = os.path.basename(self._id)
+
+        return self._basename
+
     def format_identifier(self):
         """
         Returns an identifier formatted depending on the data library
@@ -25,6 +25,8 @@ RE_RIGHT_SIDE = "Right|right|Rt|rt_|_rt|_r_|_R|R_|:r_|^r_|_r$|:R|^R"
 # TODO: Node data types should be configured depending of the DCC
 VALID_NODE_TYPES = ["joint", "transform"]
 
+_COMPILED_SIDES = dict()
+
 
 class _MetaMirrorTable(type):
 
@@ -43,6 +45,22 @@ class _MetaMirrorTable(type):
                 return type.__call__(BaseMirrorTable, *args, **kwargs)
 
 
+def compile_sides(regex_sides):
+    """
+    Returns the compiled regular expressions for the given side patterns. Compiled patterns are cached, so the
+    same side list is only compiled once
+    :param regex_sides: list(str)
+    :return: tuple(re.Pattern)
+    """
+
+    key = tuple(regex_sides)
+    compiled_sides = _COMPILED_SIDES.get(key)
+    if compiled_sides is None:
+        compiled_sides = _COMPILED_SIDES[key] = tuple(re.compile(side) for side in key)
+
+    return compiled_sides
+
+
 def save_mirror_table(path, objects, metadata=None, *args, **kwargs):
     """
     Function that saves mirror table in disk
@@ -154,8 +172,7 @@ class BaseMirrorTable(transfer.DataTransferObject()):
         :return: str
         """
 
-        regex_sides = python.force_list(regex_sides)
-        regex_sides = [re.compile(side) for side in regex_sides]
+        regex_sides = compile_sides(python.force_list(regex_sides))
 
         for obj in objects:
             for regex_side in regex_sides:
@@ -219,6 +236,27 @@ class BaseMirrorTable(transfer.DataTransferObject()):
 
         return name
 
+    @classmethod
+    def replacer(cls, old, new):
+        """
+        Returns a function that replaces the given old prefix, suffix or text with the new one in the names it
+        receives. Replace mode is resolved only once, so it can be applied to many names
+        :param old: str
+        :param new: str
+        :return: callable
+        """
+
+        # Prefix
+        if old.endswith('*') or new.endswith('*'):
+            return lambda name: cls.replace_prefix(name, old, new)
+
+        # Suffix
+        elif old.startswith('*') or new.startswith('*'):
+            return lambda name: cls.replace_suffix(name, old, new)
+
+        # Other
+        return lambda name: name.replace(old, new)
+
     @classmethod
     def find_left_side(cls, objects):
         """
@@ -266,7 +304,7 @@ class BaseMirrorTable(transfer.DataTransferObject()):
         new = new.replace('*', '')
 
         if target_name.startswith(old):
-            target_name = name.replace(old, new, 1)
+            target_name = new + name[len(old):]
 
         return target_name
 
@@ -483,7 +521,8 @@ class BaseMirrorTable(transfer.DataTransferObject()):
     def match_objects(self, objects=None, **kwargs):
         raise NotImplementedError()
 
-    def is_attribute_mirrored(self, attr, mirror_axis):
+    @classmethod
+    def is_attribute_mirrored(cls, attr, mirror_axis):
         raise NotImplementedError()
 
     # ============================================================================================================
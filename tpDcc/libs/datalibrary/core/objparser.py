@@ -0,0 +1,106 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a native OBJ reader used for previews that do not need a DCC round-trip.
+File is read in two passes: first one counts the elements, second one fills pre-allocated flat arrays
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import mmap
+import array
+from contextlib import closing
+
+
+def _iter_lines(path):
+    """
+    Internal generator that yields the lines of the given file as bytes
+    :param path: str
+    :return: generator
+    """
+
+    if not os.path.getsize(path):
+        return
+
+    with open(path, 'rb') as fh:
+        with closing(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)) as mm:
+            for line in iter(mm.readline, b''):
+                yield line
+
+
+def scan_counts(path):
+    """
+    Returns the number of vertices, faces and face indices stored in the given OBJ file
+    :param path: str
+    :return: tuple(int, int, int)
+    """
+
+    vertex_count = 0
+    face_count = 0
+    index_count = 0
+    for line in _iter_lines(path):
+        tokens = line.split()
+        if not tokens:
+            continue
+        tag = tokens[0]
+        if tag == b'v':
+            vertex_count += 1
+        elif tag == b'f':
+            face_count += 1
+            index_count += len(tokens) - 1
+
+    return vertex_count, face_count, index_count
+
+
+def parse_into(path, vertex_count, face_count, index_count):
+    """
+    Parses given OBJ file into flat arrays. Counts must be the ones returned by scan_counts function
+    :param path: str
+    :param vertex_count: int
+    :param face_count: int
+    :param index_count: int
+    :return: tuple(array.array, array.array, array.array), flat XYZ coordinates, zero based vertex indices and
+        number of vertices per face
+    """
+
+    coords = array.array('f', [0.0]) * (3 * vertex_count)
+    indices = array.array('i', [0]) * index_count
+    face_sizes = array.array('i', [0]) * face_count
+
+    vertex_index = 0
+    face_index = 0
+    index = 0
+    for line in _iter_lines(path):
+        tokens = line.split()
+        if not tokens:
+            continue
+        tag = tokens[0]
+        if tag == b'v':
+            # Missing coordinates are left as 0.0, so following vertices keep the indices faces refer to
+            offset = vertex_index * 3
+            for i, value in enumerate(tokens[1:4]):
+                coords[offset + i] = float(value)
+            vertex_index += 1
+        elif tag == b'f':
+            tokens = tokens[1:]
+            for token in tokens:
+                vertex_id = int(token.split(b'/', 1)[0])
+                # OBJ indices are 1 based and negative values are relative to the last parsed vertex
+                indices[index] = vertex_id - 1 if vertex_id > 0 else vertex_index + vertex_id
+                index += 1
+            face_sizes[face_index] = len(tokens)
+            face_index += 1
+
+    return coords, indices, face_sizes
+
+
+def read(path):
+    """
+    Reads given OBJ file and returns its geometry as flat arrays
+    :param path: str
+    :return: tuple(array.array, array.array, array.array)
+    """
+
+    return parse_into(path, *scan_counts(path))
@@ -19,6 +19,26 @@ from tpDcc.libs.datalibrary.core import consts
 
 logger = logging.getLogger(consts.LIB_ID)
 
+# Current user does not change during the session, so it is only retrieved once
+_USER = None
+
+
+def get_user():
+    """
+    Returns the name of the current user
+    :return: str
+    """
+
+    global _USER
+
+    if _USER is None:
+        user = getpass.getuser() or ''
+        if isinstance(user, bytes):
+            user = user.decode(locale.getpreferredencoding())
+        _USER = user
+
+    return _USER
+
 
 class _MetaDataTransferObject(type):
     def __call__(self, *args, **kwargs):
@@ -84,6 +104,7 @@ class BaseDataTransferObject(object):
         """
 
         self._data = data_dict
+        self._namespaces = None
 
     # =================================================================================================================
     # ABSTRACT FUNCTIONS
@@ -236,6 +257,7 @@ class BaseDataTransferObject(object):
         objects = python.force_list(objects)
         for name in objects:
             self.objects()[name] = self.parse_object(name)
+        self._namespaces = None
 
     def remove_objects(self, objects):
         """
@@ -246,6 +268,7 @@ class BaseDataTransferObject(object):
         objects = python.force_list(objects)
         for name in objects:
             del self.objects()[name]
+        self._namespaces = None
 
     def parse_object(self, name):
         """
@@ -302,13 +325,14 @@ class BaseDataTransferObject(object):
             'objects': self.objects()
         }
 
-        with open(path, 'w') as json_file:
-            self.dump(data, file_object=json_file)
-
         dirname = os.path.dirname(path)
-        if not os.path.exists(dirname):
+        if dirname and not os.path.exists(dirname):
             os.makedirs(dirname)
 
+        # Data is serialized in memory and written at once, instead of streaming many small chunks into the file
+        with open(path, 'w') as json_file:
+            json_file.write(self.dump(data))
+
         logger.info('Saved data: {}'.format(path))
 
         return True
@@ -323,10 +347,7 @@ class BaseDataTransferObject(object):
         Called before saving the data
         """
 
-        encoding = locale.getpreferredencoding()
-        user = getpass.getuser()
-        if user:
-            user = user.decode(encoding)
+        user = get_user()
         ctime = str(time.time()).split('.')[0]
 
         self.set_metadata('user', user)
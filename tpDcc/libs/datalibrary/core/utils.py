@@ -0,0 +1,110 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains utils functions used by data library
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import sys
+import mmap
+import subprocess
+from contextlib import closing
+
+try:
+    import orjson
+except ImportError:
+    import json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def open_file(file_path):
+    """
+    Opens given file with the application associated to it by the OS. Shell is not used
+    :param file_path: str
+    """
+
+    if sys.platform == 'win32':
+        os.startfile(file_path)
+    elif sys.platform == 'darwin':
+        subprocess.Popen(['open', file_path])
+    else:
+        subprocess.Popen(['xdg-open', file_path])
+
+
+def json_dumps(data, indent=False):
+    """
+    Serializes given data into JSON bytes. orjson is used if available
+    :param data: object
+    :param indent: bool, whether or not the JSON should be indented using 2 spaces
+    :return: bytes
+    """
+
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    # Match orjson compact output, default separators add a whitespace after each item and key
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(data):
+    """
+    Deserializes given JSON data. orjson is used if available
+    :param data: bytes or str
+    :return: object
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+
+    return json.loads(data)
+
+
+def json_iter_items(file_object):
+    """
+    Yields the items of the JSON array stored in the given file object. If ijson is available, items are parsed
+    incrementally, so the full array is never loaded into memory
+    :param file_object: file opened in binary mode
+    :return: generator
+    """
+
+    if ijson is not None:
+        for item in ijson.items(file_object, 'item', use_float=True):
+            yield item
+    else:
+        for item in json_load_file(file_object) or list():
+            yield item
+
+
+def json_load_file(file_object):
+    """
+    Deserializes the JSON contents of the given file object. File is memory mapped, so when orjson is available the
+    JSON is parsed directly from OS page cache without copying it into a read buffer
+    :param file_object: file opened in binary mode
+    :return: object or None, None if the file is empty
+    """
+
+    if not os.fstat(file_object.fileno()).st_size:
+        return None
+
+    with closing(mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)) as mm:
+        if orjson is None:
+            return json_loads(mm[:])
+        view = memoryview(mm)
+        try:
+            return orjson.loads(view)
+        finally:
+            view.release()
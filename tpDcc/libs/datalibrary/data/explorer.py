@@ -47,7 +47,7 @@ class ExplorerData(datapart.DataPart):
         )
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def mandatory_tags(self):
         return ['*']
@@ -8,7 +8,6 @@ Module that contains FBX data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
 import logging
 
 from tpDcc import dcc
@@ -17,6 +16,8 @@ from tpDcc.libs.datalibrary.core import consts, datapart
 
 LOGGER = logging.getLogger(consts.LIB_ID)
 
+_SUPPORTED_DCCS = (core_dcc.Dccs.Maya, core_dcc.Dccs.Max)
+
 
 class FBXData(datapart.DataPart):
 
@@ -26,11 +27,9 @@ class FBXData(datapart.DataPart):
     PRIORITY = 15
     EXTENSION = '.fbx'
 
-    _has_trait = re.compile(r'\.fbx$', re.I)
-
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if FBXData._has_trait.search(identifier):
+        if identifier[-len(FBXData.EXTENSION):].lower() == FBXData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -40,10 +39,10 @@ class FBXData(datapart.DataPart):
 
     @classmethod
     def supported_dccs(cls):
-        return [core_dcc.Dccs.Maya, core_dcc.Dccs.Max]
+        return _SUPPORTED_DCCS
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def icon(self):
         return 'fbx'
@@ -49,7 +49,7 @@ class FileData(datapart.DataPart):
         return 'file'
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def mandatory_tags(self):
 
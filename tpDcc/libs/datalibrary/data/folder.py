@@ -38,7 +38,7 @@ class FolderData(datapart.DataPart):
         return False
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def icon(self):
         return 'folder'
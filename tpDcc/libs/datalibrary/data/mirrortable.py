@@ -8,7 +8,6 @@ Module that contains locators (transform) data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
 import logging
 
 from tpDcc import dcc
@@ -17,6 +16,8 @@ from tpDcc.libs.datalibrary.core import consts, datapart, mirrortable
 
 logger = logging.getLogger(consts.LIB_ID)
 
+_SUPPORTED_DCCS = (core_dcc.Dccs.Maya,)
+
 
 class MirrorTableData(datapart.DataPart):
 
@@ -26,8 +27,6 @@ class MirrorTableData(datapart.DataPart):
     PRIORITY = 17
     EXTENSION = '.mirror'
 
-    _has_trait = re.compile(r'\.mirror$', re.I)
-
     def __init__(self, *args, **kwargs):
         super(MirrorTableData, self).__init__(*args, **kwargs)
 
@@ -35,7 +34,7 @@ class MirrorTableData(datapart.DataPart):
 
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if MirrorTableData._has_trait.search(identifier):
+        if identifier[-len(MirrorTableData.EXTENSION):].lower() == MirrorTableData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -45,10 +44,10 @@ class MirrorTableData(datapart.DataPart):
 
     @classmethod
     def supported_dccs(cls):
-        return [core_dcc.Dccs.Maya]
+        return _SUPPORTED_DCCS
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def icon(self):
         return 'mirror'
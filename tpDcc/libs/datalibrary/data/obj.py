@@ -8,15 +8,16 @@ Module that contains OBJ data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
 import logging
 
 from tpDcc import dcc
 from tpDcc.core import dcc as core_dcc
-from tpDcc.libs.datalibrary.core import consts, datapart
+from tpDcc.libs.datalibrary.core import consts, datapart, objparser
 
 LOGGER = logging.getLogger(consts.LIB_ID)
 
+_SUPPORTED_DCCS = (core_dcc.Dccs.Maya, core_dcc.Dccs.Max)
+
 
 class OBJData(datapart.DataPart):
 
@@ -26,11 +27,9 @@ class OBJData(datapart.DataPart):
     PRIORITY = 14
     EXTENSION = '.obj'
 
-    _has_trait = re.compile(r'\.obj$', re.I)
-
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if OBJData._has_trait.search(identifier):
+        if identifier[-len(OBJData.EXTENSION):].lower() == OBJData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -40,10 +39,10 @@ class OBJData(datapart.DataPart):
 
     @classmethod
     def supported_dccs(cls):
-        return [core_dcc.Dccs.Maya, core_dcc.Dccs.Max]
+        return _SUPPORTED_DCCS
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def icon(self):
         return 'obj'
@@ -59,14 +58,12 @@ class OBJData(datapart.DataPart):
 
     def functionality(self):
         return dict(
-            import_data=self.import_data
+            import_data=self.import_data,
+            preview=self.preview
         )
 
     def import_data(self, *args, **kwargs):
         filepath = self.format_identifier()
-        if not filepath.endswith(OBJData.EXTENSION):
-            filepath = '{}{}'.format(filepath, OBJData.EXTENSION)
-
         if not filepath:
             LOGGER.warning('Impossible to save OBJ file because save file path not defined!')
             return
@@ -78,3 +75,17 @@ class OBJData(datapart.DataPart):
         LOGGER.debug('Saved {} successfully!'.format(filepath))
 
         return result
+
+    def preview(self):
+        """
+        Reads OBJ geometry without a DCC round-trip. Useful for thumbnails or bounding box probes
+        :return: tuple(array.array, array.array, array.array) or None, flat XYZ coordinates, zero based vertex
+            indices and number of vertices per face
+        """
+
+        filepath = self.format_identifier()
+        if not filepath or not os.path.isfile(filepath):
+            LOGGER.warning('Impossible to preview OBJ file: "{}"'.format(filepath))
+            return None
+
+        return objparser.read(filepath)
@@ -8,10 +8,9 @@ Module that contains image data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
 from functools import partial
 
-from tpDcc.libs.datalibrary.core import datapart
+from tpDcc.libs.datalibrary.core import datapart, utils
 
 
 class PngImageData(datapart.DataPart):
@@ -20,11 +19,14 @@ class PngImageData(datapart.DataPart):
     PRIORITY = 5
     EXTENSION = '.png'
 
-    _has_trait = re.compile(r'\.png$', re.I)
+    def __init__(self, *args, **kwargs):
+        super(PngImageData, self).__init__(*args, **kwargs)
+
+        self._show_action = partial(utils.open_file, self.identifier())
 
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if PngImageData._has_trait.search(identifier):
+        if identifier[-len(PngImageData.EXTENSION):].lower() == PngImageData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -41,7 +43,7 @@ class PngImageData(datapart.DataPart):
         return '.png'
 
     def functionality(self):
-        return dict(show=partial(os.system, self.identifier(),))
+        return dict(show=self._show_action)
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
@@ -8,7 +8,8 @@ Module that contains Python script file item implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
+import mmap
+from contextlib import closing
 
 from tpDcc.libs.python import fileio
 
@@ -23,15 +24,13 @@ class PythonData(datapart.DataPart):
     PRIORITY = 5
     EXTENSION = '.py'
 
-    _has_trait = re.compile(r'\.py$', re.I)
-
     # ============================================================================================================
     # OVERRIDES
     # ============================================================================================================
 
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if PythonData._has_trait.search(identifier):
+        if identifier[-len(PythonData.EXTENSION):].lower() == PythonData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -45,7 +44,7 @@ class PythonData(datapart.DataPart):
         return 'python'
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def extension(self):
         return '.py'
@@ -55,6 +54,7 @@ class PythonData(datapart.DataPart):
 
     def functionality(self):
         return dict(
+            load=self.load,
             save=self.save
         )
 
@@ -62,6 +62,23 @@ class PythonData(datapart.DataPart):
     # BASE
     # ============================================================================================================
 
+    def load(self):
+        """
+        Returns the lines of the Python script. File is memory mapped so big autogenerated scripts are read
+        straight from OS page cache
+        :return: list(str)
+        """
+
+        file_path = self.format_identifier()
+        if not file_path or not os.path.isfile(file_path):
+            return list()
+        if not os.path.getsize(file_path):
+            return list()
+
+        with open(file_path, 'rb') as fh:
+            with closing(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)) as mm:
+                return mm[:].decode('utf-8', 'replace').splitlines(True)
+
     def save(self, **kwargs):
 
         lines = kwargs.get('lines', None)
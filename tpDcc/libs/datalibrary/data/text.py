@@ -7,13 +7,12 @@ Module that contains text data part implementation
 
 from __future__ import print_function, division, absolute_import
 
-import re
 import os
 import subprocess
 
 from tpDcc.libs.python import fileio
 
-from tpDcc.libs.datalibrary.core import datapart
+from tpDcc.libs.datalibrary.core import datapart, asyncwriter
 
 
 class TextData(datapart.DataPart):
@@ -24,15 +23,13 @@ class TextData(datapart.DataPart):
     PRIORITY = 4
     EXTENSION = '.txt'
 
-    _has_trait = re.compile(r'\.txt$', re.I)
-
     # ============================================================================================================
     # OVERRIDES
     # ============================================================================================================
 
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if TextData._has_trait.search(identifier):
+        if identifier[-len(TextData.EXTENSION):].lower() == TextData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -41,7 +38,7 @@ class TextData(datapart.DataPart):
         return False
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def extension(self):
         return '.txt'
@@ -68,9 +65,20 @@ class TextData(datapart.DataPart):
     def edit(self):
         subprocess.Popen(['notepad', self.identifier()])
 
-    def save(self):
+    def save(self, blocking=True):
+        """
+        Creates text file. By default, file is created and library synced before returning. If not blocking, file is
+        written in the background and library sync is batched with other pending writes
+        :param blocking: bool, If False, file is created by the background writer and library sync is batched and
+            called from the caller thread (on asyncwriter.WRITER.flush or on a later background save)
+        """
+
         file_path = self.format_identifier()
 
-        fileio.create_file(file_path)
+        if blocking:
+            fileio.create_file(file_path)
+            if self._db:
+                self._db.sync()
+            return
 
-        self._db.sync()
+        asyncwriter.WRITER.enqueue(file_path, callback=self._db.sync if self._db else None)
@@ -8,10 +8,9 @@ Module that contains tga image data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
 from functools import partial
 
-from tpDcc.libs.datalibrary.core import datapart
+from tpDcc.libs.datalibrary.core import datapart, utils
 
 
 class TgaImageData(datapart.DataPart):
@@ -20,11 +19,14 @@ class TgaImageData(datapart.DataPart):
     PRIORITY = 5
     EXTENSION = '.tga'
 
-    _has_trait = re.compile(r'\.tga$', re.I)
+    def __init__(self, *args, **kwargs):
+        super(TgaImageData, self).__init__(*args, **kwargs)
+
+        self._show_action = partial(utils.open_file, self.format_identifier())
 
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if TgaImageData._has_trait.search(identifier):
+        if identifier[-len(TgaImageData.EXTENSION):].lower() == TgaImageData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -41,7 +43,7 @@ class TgaImageData(datapart.DataPart):
         return '.tga'
 
     def functionality(self):
-        return dict(show=partial(os.system, self.format_identifier(),))
+        return dict(show=self._show_action)
 
     def label(self):
-        return os.path.basename(self.format_identifier())
+        return self.basename()
@@ -8,16 +8,18 @@ Module that contains locators (transform) data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
-import json
 import logging
 
 from tpDcc import dcc
 from tpDcc.core import dcc as core_dcc
-from tpDcc.libs.datalibrary.core import consts, datapart
+from tpDcc.libs.datalibrary.core import consts, datapart, utils
 
 LOGGER = logging.getLogger(consts.LIB_ID)
 
+IDENTITY_MATRIX = (1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+
+_SUPPORTED_DCCS = (core_dcc.Dccs.Maya, core_dcc.Dccs.Max)
+
 
 class TransformsData(datapart.DataPart):
 
@@ -27,11 +29,9 @@ class TransformsData(datapart.DataPart):
     PRIORITY = 15
     EXTENSION = '.xform'
 
-    _has_trait = re.compile(r'\.xform$', re.I)
-
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if TransformsData._has_trait.search(identifier):
+        if identifier[-len(TransformsData.EXTENSION):].lower() == TransformsData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -41,10 +41,10 @@ class TransformsData(datapart.DataPart):
 
     @classmethod
     def supported_dccs(cls):
-        return [core_dcc.Dccs.Maya, core_dcc.Dccs.Max]
+        return _SUPPORTED_DCCS
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def icon(self):
         return 'matrix'
@@ -67,16 +67,15 @@ class TransformsData(datapart.DataPart):
 
     def save(self, *args, **kwargs):
         filepath = self.format_identifier()
-        if not filepath.endswith(TransformsData.EXTENSION):
-            filepath = '{}{}'.format(filepath, TransformsData.EXTENSION)
-
         if not filepath:
             LOGGER.warning('Impossible to save locators file because save file path not defined!')
             return
 
+        client = dcc.client()
+
         objects = kwargs.get('objects', None)
         if not objects:
-            objects = dcc.client().selected_nodes(full_path=True)
+            objects = client.selected_nodes(full_path=True)
         if not objects:
             LOGGER.warning('Select locators to export')
             return False
@@ -88,34 +87,54 @@ class TransformsData(datapart.DataPart):
                 continue
             valid_nodes.append(object)
 
-        transforms_data = list()
-
-        visited_nodes = dict()
-        for i, node in enumerate(valid_nodes):
-            node_data = dict()
-            node_short_name = dcc.client().node_short_name(node, remove_namespace=True)
-            node_data['name'] = node_short_name
-            node_data['index'] = i
-            node_data['world_matrix'] = dcc.client().node_world_matrix(node)
-            visited_nodes[node_short_name] = i
-            parent_index = None
-            parent_node = dcc.client().node_parent(node)
-            if parent_node:
-                parent_short_name = dcc.client().node_short_name(parent_node, remove_namespace=True)
-                if parent_short_name in visited_nodes:
-                    parent_index = visited_nodes[parent_short_name]
-            if parent_index is None:
-                parent_index = -1
-            node_data['parent_index'] = parent_index
-
-            # For now we only store namespaces in Maya
-            if dcc.client().is_maya():
-                node_namespace = dcc.client().node_namespace(node) or ''
-                if node_namespace.startswith('|'):
-                    node_namespace = node_namespace[1:]
-                node_data['namespace'] = node_namespace
-
-            transforms_data.append(node_data)
+        node_short_name = client.node_short_name
+        node_world_matrix = client.node_world_matrix
+        node_parent = client.node_parent
+
+        short_names = {node: node_short_name(node, remove_namespace=True) for node in valid_nodes}
+        visited_nodes = {short_names[node]: i for i, node in enumerate(valid_nodes)}
+
+        # Parents that are also being saved reuse the short name we already have, so the DCC is only queried
+        # for parents outside of the saved nodes
+        parent_indices = list()
+        for node in valid_nodes:
+            parent_node = node_parent(node)
+            if not parent_node:
+                parent_indices.append(-1)
+                continue
+            parent_short_name = short_names.get(parent_node)
+            if parent_short_name is None:
+                parent_short_name = node_short_name(parent_node, remove_namespace=True)
+            parent_indices.append(visited_nodes.get(parent_short_name, -1))
+
+        # Nodes are stored with parents before their children, so import can parent nodes while creating them
+        sorted_indices = _hierarchy_order(parent_indices)
+        new_indices = dict((old_index, i) for i, old_index in enumerate(sorted_indices))
+        valid_nodes = [valid_nodes[i] for i in sorted_indices]
+        parent_indices = [new_indices.get(parent_indices[i], -1) for i in sorted_indices]
+
+        def _emit_plain(i, node, parent_index):
+            return {
+                'name': short_names[node],
+                'index': i,
+                'world_matrix': node_world_matrix(node),
+                'parent_index': parent_index
+            }
+
+        def _emit_maya(i, node, parent_index):
+            node_data = _emit_plain(i, node, parent_index)
+            node_data['namespace'] = (node_namespace(node) or '').lstrip('|')
+            return node_data
+
+        # For now we only store namespaces in Maya
+        if client.is_maya():
+            node_namespace = client.node_namespace
+            emit = _emit_maya
+        else:
+            emit = _emit_plain
+
+        transforms_data = [
+            emit(i, node, parent_index) for i, (node, parent_index) in enumerate(zip(valid_nodes, parent_indices))]
 
         if not transforms_data:
             LOGGER.warning('No transforms data found!')
@@ -124,8 +143,8 @@ class TransformsData(datapart.DataPart):
         LOGGER.debug('Saving {} | {}'.format(filepath, kwargs))
 
         try:
-            with open(filepath, 'w') as json_file:
-                json.dump(transforms_data, json_file, indent=2)
+            with open(filepath, 'wb') as json_file:
+                json_file.write(utils.json_dumps(transforms_data, indent=True))
         except IOError:
             LOGGER.error('Transforms data not saved to file {}'.format(filepath))
             return False
@@ -136,64 +155,61 @@ class TransformsData(datapart.DataPart):
 
     def import_data(self, *args, **kwargs):
         filepath = self.format_identifier()
-        if not filepath.endswith(TransformsData.EXTENSION):
-            filepath = '{}{}'.format(filepath, TransformsData.EXTENSION)
-
         if not filepath:
             LOGGER.warning('Impossible to load Locators file because save file path not defined!')
             return False
 
-        LOGGER.debug('Loading {} | {}'.format(filepath, kwargs))
-
-        with open(filepath, 'r') as fh:
-            transforms_data = json.load(fh)
-        if not transforms_data:
+        # Smallest valid transforms file is an empty JSON list, so there is no need to parse smaller files
+        if not os.path.isfile(filepath) or os.path.getsize(filepath) < 2:
             LOGGER.warning('No transforms data found in file: "{}"'.format(filepath))
             return False
 
+        LOGGER.debug('Loading {} | {}'.format(filepath, kwargs))
+
         # TODO: Use metadata to verify DCC and also to create nodes with proper up axis
         metadata = self.metadata()
 
+        client = dcc.client()
+
+        # Node data is stored in parallel lists indexed by node index. Indices are written in file order on save
         transform_list = list()
-        created_transforms = dict()
-
-        for node_data in transforms_data:
-            node_index = node_data.get('index', 0)
-            node_parent_index = node_data.get('parent_index', -1)
-            node_name = node_data.get('name', 'new_transform')
-            node_namespace = node_data.get('namespace', '')
-            node_world_matrix = node_data.get(
-                'world_matrix', [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0])
-            dcc.client().clear_selection()
-            new_node = dcc.client().create_locator(name=node_name)
-            dcc.client().set_node_world_matrix(new_node, node_world_matrix)
-            created_transforms[node_index] = {
-                'node': new_node, 'parent_index': node_parent_index, 'namespace': node_namespace
-            }
-            transform_list.append(new_node)
+        namespaces = list()
+
+        # Files are saved with parents before their children, so nodes are parented while the file is parsed.
+        # Files saved with an older version can still reference parents that are not created yet
+        pending_parents = list()
+        client.clear_selection()
+        with open(filepath, 'rb') as fh:
+            for node_data in utils.json_iter_items(fh):
+                node_name = node_data.get('name', 'new_transform')
+                node_world_matrix = node_data.get('world_matrix')
+                if node_world_matrix is None:
+                    node_world_matrix = list(IDENTITY_MATRIX)
+                new_node = client.create_locator(name=node_name)
+                client.set_node_world_matrix(new_node, node_world_matrix)
+                parent_index = node_data.get('parent_index', -1)
+                if 0 <= parent_index < len(transform_list):
+                    client.set_parent(new_node, transform_list[parent_index])
+                elif parent_index >= 0:
+                    pending_parents.append((new_node, parent_index))
+                transform_list.append(new_node)
+                namespaces.append(node_data.get('namespace', ''))
+
+        if not transform_list:
+            LOGGER.warning('No transforms data found in file: "{}"'.format(filepath))
+            return False
 
-        for node_index, node_data in created_transforms.items():
-            parent_index = node_data['parent_index']
-            if parent_index < -1:
-                continue
-            node_data = created_transforms.get(node_index, None)
-            if not node_data:
-                continue
-            node_name = node_data.get('node')
-            parent_node_data = created_transforms.get(parent_index, None)
-            if not parent_node_data:
-                continue
-            parent_node_name = parent_node_data.get('node')
-            dcc.client().set_parent(node_name, parent_node_name)
+        node_count = len(transform_list)
+        for node_name, parent_index in pending_parents:
+            if parent_index < node_count:
+                client.set_parent(node_name, transform_list[parent_index])
 
         # We assign namespaces once the hierarchy of nodes is created
-        for node_index, node_data in created_transforms.items():
-            node_name = node_data.get('node')
-            node_namespace = node_data.get('namespace')
+        for node_name, node_namespace in zip(transform_list, namespaces):
             if node_namespace:
-                dcc.client().assign_node_namespace(node_name, node_namespace, force_create=True)
+                client.assign_node_namespace(node_name, node_namespace, force_create=True)
 
-        dcc.client().clear_selection()
+        client.clear_selection()
 
         LOGGER.debug('Loaded {} successfully!'.format(filepath))
 
@@ -202,22 +218,24 @@ class TransformsData(datapart.DataPart):
     def export_data(self, *args, **kwargs):
 
         filepath = self.format_identifier()
-        if not filepath.endswith(TransformsData.EXTENSION):
-            filepath = '{}{}'.format(filepath, TransformsData.EXTENSION)
-
         if not filepath or not os.path.isfile(filepath):
             LOGGER.warning('Impossible to export transforms data to: "{}"'.format(filepath))
             return
 
+        if os.path.getsize(filepath) < 2:
+            LOGGER.warning('No transforms data found in file: "{}"'.format(filepath))
+            return False
+
         LOGGER.debug('Exporting: {} | {}'.format(filepath, kwargs))
 
-        with open(filepath, 'r') as fh:
-            transforms_data = json.load(fh)
+        with open(filepath, 'rb') as fh:
+            transforms_data = utils.json_load_file(fh)
         if not transforms_data:
             LOGGER.warning('No transforms data found in file: "{}"'.format(filepath))
             return False
 
-        selected_nodes = dcc.client().selected_nodes(full_path=False)
+        client = dcc.client()
+        selected_nodes = client.selected_nodes(full_path=False)
 
         saved_nodes = list()
         if not selected_nodes:
@@ -233,7 +251,7 @@ class TransformsData(datapart.DataPart):
 
         valid_nodes = list()
         for selected_node in saved_nodes:
-            if not dcc.client().node_exists(selected_node) or not dcc.client().node_is_transform(selected_node):
+            if not client.node_exists(selected_node) or not client.node_is_transform(selected_node):
                 continue
             valid_nodes.append(selected_node)
 
@@ -242,3 +260,23 @@ class TransformsData(datapart.DataPart):
             return False
 
         return self.save(objects=valid_nodes)
+
+
+def _hierarchy_order(parent_indices):
+    """
+    Returns node indices sorted so parent nodes are always placed before their children
+    :param parent_indices: list(int), parent index of each node or -1 if node has no parent
+    :return: list(int)
+    """
+
+    sorted_indices = list()
+    visited = set()
+    for index in range(len(parent_indices)):
+        chain = list()
+        while index >= 0 and index not in visited:
+            visited.add(index)
+            chain.append(index)
+            index = parent_indices[index]
+        sorted_indices.extend(reversed(chain))
+
+    return sorted_indices
@@ -8,7 +8,6 @@ Module that contains 3ds Max file data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
 import logging
 
 from tpDcc import dcc
@@ -18,6 +17,8 @@ from tpDcc.libs.datalibrary.core import consts, datapart
 
 logger = logging.getLogger(consts.LIB_ID)
 
+_SUPPORTED_DCCS = (core_dcc.Dccs.Max,)
+
 
 class MaxFile(datapart.DataPart):
 
@@ -27,11 +28,9 @@ class MaxFile(datapart.DataPart):
     PRIORITY = 10
     EXTENSION = '.max'
 
-    _has_trait = re.compile(r'\.max$', re.I)
-
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if MaxFile._has_trait.search(identifier):
+        if identifier[-len(MaxFile.EXTENSION):].lower() == MaxFile.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -41,10 +40,10 @@ class MaxFile(datapart.DataPart):
 
     @classmethod
     def supported_dccs(cls):
-        return [core_dcc.Dccs.Max]
+        return _SUPPORTED_DCCS
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def icon(self):
         return 'max'
@@ -72,9 +71,6 @@ class MaxFile(datapart.DataPart):
         """
 
         filepath = self.format_identifier()
-        if not filepath.endswith(MaxFile.EXTENSION):
-            filepath = '{}{}'.format(filepath, MaxFile.EXTENSION)
-
         if not filepath or not os.path.isfile(filepath):
             logger.warning('Impossible to open 3ds Max file data from: "{}"'.format(filepath))
             return
@@ -87,9 +83,6 @@ class MaxFile(datapart.DataPart):
         """
 
         filepath = self.format_identifier()
-        if not filepath.endswith(MaxFile.EXTENSION):
-            filepath = '{}{}'.format(filepath, MaxFile.EXTENSION)
-
         if not filepath or not os.path.isfile(filepath):
             return
 
@@ -104,9 +97,6 @@ class MaxFile(datapart.DataPart):
         """
 
         filepath = self.format_identifier()
-        if not filepath.endswith(MaxFile.EXTENSION):
-            filepath = '{}{}'.format(filepath, MaxFile.EXTENSION)
-
         if not filepath:
             logger.warning('Impossible to save 3ds Max file because save file path not defined!')
             return
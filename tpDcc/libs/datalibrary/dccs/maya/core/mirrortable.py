@@ -7,7 +7,6 @@ Module that contains base mirror table data transfer object implementation for M
 
 from __future__ import print_function, division, absolute_import
 
-import re
 import logging
 
 import maya.cmds
@@ -21,6 +20,14 @@ from tpDcc.libs.datalibrary.dccs.maya.core import utils
 
 logger = logging.getLogger(consts.LIB_ID)
 
+# Attributes whose values must be negated when mirroring, by mirror axis
+MIRRORED_ATTRIBUTES = {
+    (-1, 1, 1): frozenset(('translateX', 'rotateY', 'rotateZ')),
+    (1, -1, 1): frozenset(('translateY', 'rotateX', 'rotateZ')),
+    (1, 1, -1): frozenset(('translateZ', 'rotateX', 'rotateY')),
+    (-1, -1, -1): frozenset(('translateX', 'translateY', 'translateZ'))
+}
+
 
 class MayaMirrorTable(mirrortable.BaseMirrorTable):
     def __init__(self, *args, **kwargs):
@@ -42,8 +49,7 @@ class MayaMirrorTable(mirrortable.BaseMirrorTable):
         if python.is_string(regex_sides):
             regex_sides = regex_sides.split('|')
 
-        regex_sides = python.force_list(regex_sides)
-        regex_sides = [re.compile(side) for side in regex_sides]
+        regex_sides = mirrortable.compile_sides(python.force_list(regex_sides))
 
         for obj in objects:
             obj = obj.split('|')[-1].split(':')[-1]
@@ -83,7 +89,7 @@ class MayaMirrorTable(mirrortable.BaseMirrorTable):
         if '|' in name:
             target_name = name.replace('|' + old, '|' + new)
         elif target_name.startswith(old):
-            target_name = name.replacde(old, new, 1)
+            target_name = new + name[len(old):]
 
         return target_name
 
@@ -114,31 +120,19 @@ class MayaMirrorTable(mirrortable.BaseMirrorTable):
     def match_objects(self, objects=None, **kwargs):
         namespaces = kwargs.pop('namespaces', None)
 
-        source_objects = list(self.objects().keys())
+        source_objects = self.objects().keys()
         matches = utils.match_names(source_objects, target_objects=objects, target_namespaces=namespaces)
         for source_node, target_node in matches:
             target_name = target_node.name()
             mirror_axis = self.mirror_axis(source_node.name())
             yield source_node.name(), target_name, mirror_axis
 
-    def is_attribute_mirrored(self, attr, mirror_axis):
-        if mirror_axis == [-1, 1, 1]:
-            if attr == "translateX" or attr == "rotateY" or attr == "rotateZ":
-                return True
-
-        elif mirror_axis == [1, -1, 1]:
-            if attr == "translateY" or attr == "rotateX" or attr == "rotateZ":
-                return True
-
-        elif mirror_axis == [1, 1, -1]:
-            if attr == "translateZ" or attr == "rotateX" or attr == "rotateY":
-                return True
-
-        elif mirror_axis == [-1, -1, -1]:
-            if attr == "translateX" or attr == "translateY" or attr == "translateZ":
-                return True
+    @classmethod
+    def is_attribute_mirrored(cls, attr, mirror_axis):
+        if not mirror_axis:
+            return False
 
-        return False
+        return attr in MIRRORED_ATTRIBUTES.get(tuple(mirror_axis), ())
 
     @decorators.timestamp
     @maya_decorators.undo
@@ -163,11 +157,12 @@ class MayaMirrorTable(mirrortable.BaseMirrorTable):
                 raise ValueError('Invalid load option: {}'.format(option))
 
         self.validate(namespaces=namespaces)
+        utils.invalidate_attribute_cache()
 
         results = dict()
         animation = True
         found_object = False
-        source_objects = list(self.objects().keys())
+        source_objects = self.objects().keys()
 
         if option is None:
             option = mirrortable.MirrorOptions.Swap
@@ -217,16 +212,21 @@ class MayaMirrorTable(mirrortable.BaseMirrorTable):
                 maya.cmds.pasteKey(target_object, time=time, option='replace')
         if attrs is None:
             attrs = maya.cmds.listAttr(source_object, keyable=True) or list()
+
+        # Mirrored animation curves are scaled with a single command once all attributes are processed
+        mirrored_attrs = list()
         for attr in attrs:
             source_attr = utils.Attribute(source_object, attr)
             target_attr = utils.Attribute(target_object, attr)
             if target_attr.exists():
                 if target_attr.is_connected():
                     if self.is_attribute_mirrored(attr, mirror_axis):
-                        maya.cmds.scaleKey(target_attr.name(), valueScale=-1, attribute=attr)
+                        mirrored_attrs.append(attr)
                 else:
                     value = source_attr.value
                     self.set_attribute(target_object, attr, value, mirror_axis=mirror_axis)
+        if mirrored_attrs:
+            maya.cmds.scaleKey(target_object, valueScale=-1, attribute=mirrored_attrs)
 
     # ============================================================================================================
     # INTERNAL
@@ -243,4 +243,4 @@ class MayaMirrorTable(mirrortable.BaseMirrorTable):
         :return: str
         """
 
-        pass
+        return new.join(name.rsplit(old, count))
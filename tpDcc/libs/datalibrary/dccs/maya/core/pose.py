@@ -7,17 +7,22 @@ Module function that contains util class to handle pose data information
 
 from __future__ import print_function, division, absolute_import
 
+import os
+import time
 import logging
+from collections import OrderedDict
 
 from tpDcc import dcc
-from tpDcc.libs.python import decorators, path as path_utils
+from tpDcc.libs.python import path as path_utils
 
 from tpDcc.libs.datalibrary.core import consts, exceptions
-from tpDcc.libs.datalibrary.dccs.maya.core import utils, transfer, selectionset
+from tpDcc.libs.datalibrary.dccs.maya.core import utils, transfer, selectionset, mirrortable
 
 logger = logging.getLogger(consts.LIB_ID)
 
-_LOADED_POSE = None
+# Most recently loaded poses, keyed by path and modification time so poses modified on disk are parsed again
+POSE_CACHE_SIZE = 8
+_POSE_CACHE = OrderedDict()
 
 
 def save_pose(path, objects, metadata=None):
@@ -46,24 +51,35 @@ def load_pose(path, *args, **kwargs):
     :return: Pose
     """
 
-    global _LOADED_POSE
-
     clear_cache = kwargs.get('clear_cache', False)
-    if not _LOADED_POSE or path_utils.clean_path(_LOADED_POSE.path) != path_utils.clean_path(path) or clear_cache:
-        _LOADED_POSE = Pose.from_path(path)
-    _LOADED_POSE.load(*args, **kwargs)
+    cache_key = (path_utils.clean_path(path), os.path.getmtime(path))
+    loaded_pose = _POSE_CACHE.pop(cache_key, None)
+    if loaded_pose is None or clear_cache:
+        loaded_pose = Pose.from_path(path)
+    _POSE_CACHE[cache_key] = loaded_pose
+    while len(_POSE_CACHE) > POSE_CACHE_SIZE:
+        _POSE_CACHE.popitem(last=False)
+    loaded_pose.load(*args, **kwargs)
 
-    return _LOADED_POSE
+    return loaded_pose
 
 
 class Pose(transfer.MayaDataTransferObject):
     def __init__(self):
         super(Pose, self).__init__()
 
-        self._cache = None
+        # Cached attributes are stored as parallel lists (target node name, attribute, value and mirror value)
+        self._cache_names = list()
+        self._cache_attrs = list()
+        self._cache_values = list()
+        self._cache_mirror_values = list()
         self._cache_key = None
+        self._cache_signature = None
+        self._objects_cache = None
         self._mtime = None
         self._mirror_table = None
+        self._mirror_lookup = dict()
+        self._scene_nodes = None
         self._is_loading = False
         self._selection = None
         self._auto_key_frame = None
@@ -76,15 +92,33 @@ class Pose(transfer.MayaDataTransferObject):
     def cache(self):
         """
         Returns the current cached attributes for the pose
-        :return: list
+        :return: list(tuple(str, str, object, object)), list of target node name, attribute, value and mirror value
         """
 
-        return self._cache
+        return list(zip(self._cache_names, self._cache_attrs, self._cache_values, self._cache_mirror_values))
+
+    @transfer.MayaDataTransferObject.data.setter
+    def data(self, data_dict):
+        """
+        Sets the pose data. Pose cache is rebuilt on next load
+        :param data_dict: dict
+        """
+
+        transfer.MayaDataTransferObject.data.fset(self, data_dict)
+        self._reset_objects_cache()
 
     # =================================================================================================================
     # OVERRIDES
     # =================================================================================================================
 
+    def add_objects(self, objects):
+        super(Pose, self).add_objects(objects)
+        self._reset_objects_cache()
+
+    def remove_objects(self, objects):
+        super(Pose, self).remove_objects(objects)
+        self._reset_objects_cache()
+
     def parse_object(self, name):
         """
         Returns the object data for the given object name
@@ -92,22 +126,35 @@ class Pose(transfer.MayaDataTransferObject):
         :return: dict
         """
 
-        attrs = list(set(dcc.client().list_attributes(name, unlocked=True, keyable=True) or list()))
-        attrs = [utils.Attribute(name, attr) for attr in attrs]
+        client = self._client
+        attrs = list(OrderedDict.fromkeys(client.list_attributes(name, unlocked=True, keyable=True) or tuple()))
 
-        data_dict = {'attrs': self.attrs(name), 'uuid': dcc.client().node_handle(name)}
+        data_dict = {'attrs': self.attrs(name), 'uuid': client.node_handle(name)}
+        if not attrs:
+            return data_dict
 
+        # Listed attributes are known to exist, so we read their type and value directly instead of wrapping them
+        # into Attribute instances (that query existence, type and valid types for each attribute)
+        valid_types = client.get_valid_attribute_types()
+        get_attribute_type = client.get_attribute_type
+        get_attribute_value = client.get_attribute_value
+        node_attrs = data_dict['attrs']
         for attr in attrs:
-            if not attr.is_valid():
+            try:
+                attr_type = get_attribute_type(name, attr)
+                if attr_type not in valid_types:
+                    continue
+                attr_value = get_attribute_value(name, attr)
+            except Exception:
+                logger.exception('Cannot get attribute data for "{}.{}"'.format(name, attr))
                 continue
-            if attr.value is None:
-                logger.warning('Cannot save the attribute {} with value None'.format(attr.fullname))
+            if attr_value is None:
+                logger.warning('Cannot save the attribute {}.{} with value None'.format(name, attr))
             else:
-                data_dict['attrs'][attr.attr] = {'type': attr.type, 'value': attr.value}
+                node_attrs[attr] = {'type': attr_type, 'value': attr_value}
 
         return data_dict
 
-    @decorators.timestamp
     def load(self, *args, **kwargs):
         """
         Loads the pose to the given objects or namespaces
@@ -116,6 +163,9 @@ class Pose(transfer.MayaDataTransferObject):
         :return:
         """
 
+        # Pose loads can happen every frame in batch mode, so they are only timed when debug logging is enabled
+        start_time = time.time() if logger.isEnabledFor(logging.DEBUG) else None
+
         blend = kwargs.get('blend', 100)
         key = kwargs.get('key', False)
         additive = kwargs.get('additive', False)
@@ -132,7 +182,10 @@ class Pose(transfer.MayaDataTransferObject):
         if batch_mode:
             key = False
 
-        self.update_cache(**kwargs)
+        # In batch mode the cache is reused while neither the pose file nor the load options change
+        if not batch_mode or not self._cache_names or kwargs.get('clear_cache', True) or \
+                self._cache_signature != self._get_cache_signature(**kwargs) or self._mtime != self.mtime():
+            self.update_cache(**kwargs)
 
         self._before_load(clear_selection=clear_selection)
 
@@ -146,6 +199,9 @@ class Pose(transfer.MayaDataTransferObject):
         if refresh:
             dcc.refresh_viewport()
 
+        if start_time is not None:
+            logger.debug('Pose "{}" loaded in {:.3f} seconds'.format(self.path, time.time() - start_time))
+
     # =================================================================================================================
     # BASE
     # =================================================================================================================
@@ -157,7 +213,7 @@ class Pose(transfer.MayaDataTransferObject):
         :return: dict
         """
 
-        return self.object(name).get('attrs', dict())
+        return self._objects().get(name, dict()).get('attrs', dict())
 
     def attr(self, name, attr):
         """
@@ -205,6 +261,7 @@ class Pose(transfer.MayaDataTransferObject):
 
         objects = list(self.objects().keys())
         self._mirror_table = mirror_table
+        self._mirror_lookup = dict()
 
         for source_name, target_name, mirror_axis in mirror_table.match_objects(objects):
             self.set_mirror_axis(target_name, mirror_axis)
@@ -217,8 +274,9 @@ class Pose(transfer.MayaDataTransferObject):
         """
 
         result = None
-        if name in self.objects():
-            result = self.object(name).get('mirror_axis', None)
+        objects = self._objects()
+        if name in objects:
+            result = objects[name].get('mirror_axis', None)
         if result is None:
             logger.debug('Cannot find mirror axis in pose for "{}"'.format(name))
 
@@ -231,8 +289,9 @@ class Pose(transfer.MayaDataTransferObject):
         :param mirror_axis: list(int)
         """
 
-        if name in self.objects():
-            self.object(name).setdefault('mirror_axis', mirror_axis)
+        objects = self._objects()
+        if name in objects:
+            objects[name].setdefault('mirror_axis', mirror_axis)
         else:
             logger.debug('Object does not exist in pose. Cannot set mirror axis for "{}"'.format(name))
 
@@ -275,30 +334,39 @@ class Pose(transfer.MayaDataTransferObject):
             self._mtime = self.mtime()
         mtime = self._mtime
 
-        current_time = dcc.get_current_time()
-        cache_key_list = [mtime, objects, attrs, namespaces, ignore_connected, search_and_replace, current_time]
-        cache_key = ''.join([str(cache_key_item) for cache_key_item in cache_key_list])
+        cache_signature = self._get_cache_signature(**kwargs)
+        cache_key = (mtime,) + cache_signature
         if self._cache_key != cache_key or clear_cache:
+            # Nodes could have been renamed, deleted or created since last load, so attribute types are queried again
+            utils.invalidate_attribute_cache()
             self.validate(namespaces=namespaces)
-            self._cache = list()
+            self._cache_names = list()
+            self._cache_attrs = list()
+            self._cache_values = list()
+            self._cache_mirror_values = list()
             self._cache_key = cache_key
-            target_objects = objects
-            source_objects = self.objects()
-            using_namespaces = not objects and namespaces
-            if mirror_table:
-                self.set_mirror_table(mirror_table)
-            search = None
-            replace = None
-            if search_and_replace:
-                search = search_and_replace[0]
-                replace = search_and_replace[1]
-            matches = utils.match_names(source_objects, target_objects=target_objects, search=search, replace=replace)
-            for source_node, target_node in matches:
-                self.cache_node(
-                    source_node, target_node, attrs=attrs, only_connected=only_connected,
-                    ignore_connected=ignore_connected, using_namespaces=using_namespaces)
-
-        if not self.cache:
+            self._cache_signature = cache_signature
+            self._objects_cache = self.objects()
+            self._scene_nodes = None
+            try:
+                target_objects = objects
+                source_objects = self._objects_cache
+                using_namespaces = not objects and namespaces
+                if mirror_table:
+                    self.set_mirror_table(mirror_table)
+                transform = None
+                if search_and_replace:
+                    transform = mirrortable.MayaMirrorTable.replacer(search_and_replace[0], search_and_replace[1])
+                matches = utils.match_names(source_objects, target_objects=target_objects, transform=transform)
+                for source_node, target_node in matches:
+                    self.cache_node(
+                        source_node, target_node, attrs=attrs, only_connected=only_connected,
+                        ignore_connected=ignore_connected, using_namespaces=using_namespaces)
+            finally:
+                self._objects_cache = None
+                self._scene_nodes = None
+
+        if not self._cache_names:
             raise exceptions.NoMatchFoundError('No objects match when loading pose data')
 
     def cache_node(self, source_node, target_node, **kwargs):
@@ -314,26 +382,11 @@ class Pose(transfer.MayaDataTransferObject):
         only_connected = kwargs.get('only_connected', None)
         using_namespaces = kwargs.get('using_namespaces', None)
 
-        mirror_axis = None
-        mirror_object = None
-
         # remove first pipe in case object has a parent node
         target_node.strip_first_pipe()
         source_name = source_node.name()
 
-        if self.mirror_table():
-            mirror_object = self.mirror_table().mirror_object(source_name)
-            if not mirror_object or not dcc.node_exists(mirror_object):
-                mirror_object = self.mirror_table().mirror_object(dcc.client().node_short_name(source_name))
-            if not mirror_object:
-                mirror_object = source_name
-                logger.warning('Cannot find mirror object in pose for "{}"'.format(source_name))
-
-            # retrieve mirror axis from mirror object or from source node
-            mirror_axis = self.mirror_axis(mirror_object) or self.mirror_axis(source_name)
-
-            if mirror_object and not dcc.node_exists(mirror_object):
-                logger.warning('Mirror object does not exist in the scene {}'.format(mirror_object))
+        mirror_object, mirror_axis = self._mirror_data(source_name)
 
         if using_namespaces:
             try:
@@ -345,21 +398,24 @@ class Pose(transfer.MayaDataTransferObject):
                 logger.warning(exc)
                 return
 
-        for attr in self.attrs(source_name):
+        # Cache only stores plain data. Target attributes are created when the pose is applied
+        target_name = target_node.name()
+        check_connections = ignore_connected or only_connected
+        for attr, attr_data in self.attrs(source_name).items():
             if attrs and attr not in attrs:
                 continue
-            target_attribute = utils.Attribute(target_node.name(), attr)
-            is_connected = target_attribute.is_connected()
-            if (ignore_connected and is_connected) or (only_connected and not is_connected):
-                continue
+            if check_connections:
+                is_connected = utils.Attribute(target_name, attr).is_connected()
+                if (ignore_connected and is_connected) or (only_connected and not is_connected):
+                    continue
 
-            attr_type = self.attr_type(source_name, attr)
-            attr_value = self.attr_value(source_name, attr)
+            attr_value = attr_data.get('value', None)
             source_mirror_value = self.mirror_value(mirror_object, attr, mirror_axis=mirror_axis)
-            source_attribute = utils.Attribute(target_node.name(), attr, value=attr_value, type=attr_type)
-            target_attribute.clear_cache()
 
-            self._cache.append((source_attribute, target_attribute, source_mirror_value))
+            self._cache_names.append(target_name)
+            self._cache_attrs.append(attr)
+            self._cache_values.append(attr_value)
+            self._cache_mirror_values.append(source_mirror_value)
 
     def load_cache(self, blend=100, key=False, mirror=False, additive=False):
         """
@@ -370,19 +426,21 @@ class Pose(transfer.MayaDataTransferObject):
         :param additive: bool
         """
 
-        cache = self.cache
-        if not cache:
+        # Blending a pose at 0 sets every attribute to its current value, so there is nothing to do unless keying
+        names = self._cache_names
+        if not names or (blend == 0 and not key):
             return
 
-        for i in range(len(cache)):
-            source_attribute, target_attribute, source_mirror_value = cache[i]
-            if not source_attribute or not target_attribute:
+        cache = zip(names, self._cache_attrs, self._cache_values, self._cache_mirror_values)
+        for i, (target_name, attr, attr_value, source_mirror_value) in enumerate(cache):
+            if not target_name:
                 continue
-            value = source_mirror_value if mirror and source_mirror_value is not None else source_attribute.value
+            value = source_mirror_value if mirror and source_mirror_value is not None else attr_value
+            target_attribute = utils.Attribute(target_name, attr)
             try:
                 target_attribute.set(value, blend=blend, key=key, additive=additive)
             except (ValueError, RuntimeError):
-                cache[i] = (None, None)
+                names[i] = None
                 logger.warning('Ignoring {}'.format(target_attribute.fullname))
 
     def select(self, objects=None, namespaces=None, **kwargs):
@@ -400,6 +458,94 @@ class Pose(transfer.MayaDataTransferObject):
     # INTERNAL
     # =================================================================================================================
 
+    def _reset_objects_cache(self):
+        """
+        Internal function that discards the cached objects data and forces the pose cache to be rebuilt on next load
+        """
+
+        self._objects_cache = None
+        self._cache_key = None
+        self._cache_signature = None
+
+    def _objects(self):
+        """
+        Internal function that returns the objects data, reusing the one cached while updating the pose cache
+        :return: dict
+        """
+
+        if self._objects_cache is not None:
+            return self._objects_cache
+
+        return self.objects()
+
+    def _get_cache_signature(self, **kwargs):
+        """
+        Internal function that returns the load options the pose cache depends on
+        :param kwargs: dict
+        :return: tuple
+        """
+
+        objects = kwargs.get('objects', None)
+        namespaces = kwargs.get('namespaces', None)
+        attrs = kwargs.get('attrs', None)
+        search_and_replace = kwargs.get('search_and_replace', None)
+
+        return (
+            tuple(objects) if objects else None, tuple(attrs) if attrs else None,
+            tuple(namespaces) if namespaces else None, kwargs.get('ignore_connected', False),
+            kwargs.get('only_connected', False), tuple(search_and_replace) if search_and_replace else None,
+            kwargs.get('mirror_table', None))
+
+    def _mirror_data(self, source_name):
+        """
+        Internal function that returns the mirror object and mirror axis of the given pose object.
+        Results are stored in a lookup table until a new mirror table is set
+        :param source_name: str
+        :return: tuple(str or None, list(int) or None)
+        """
+
+        mirror_table = self.mirror_table()
+        if not mirror_table:
+            return None, None
+
+        mirror_data = self._mirror_lookup.get(source_name, None)
+        if mirror_data is not None:
+            return mirror_data
+
+        mirror_object = mirror_table.mirror_object(source_name)
+        if not mirror_object or not self._node_exists(mirror_object):
+            mirror_object = mirror_table.mirror_object(self._client.node_short_name(source_name))
+        if not mirror_object:
+            mirror_object = source_name
+            logger.warning('Cannot find mirror object in pose for "{}"'.format(source_name))
+
+        # retrieve mirror axis from mirror object or from source node
+        mirror_axis = self.mirror_axis(mirror_object) or self.mirror_axis(source_name)
+
+        if mirror_object and not self._node_exists(mirror_object):
+            logger.warning('Mirror object does not exist in the scene {}'.format(mirror_object))
+
+        mirror_data = self._mirror_lookup[source_name] = (mirror_object, mirror_axis)
+
+        return mirror_data
+
+    def _node_exists(self, name):
+        """
+        Internal function that returns whether or not given node exists in current scene.
+        Scene nodes are listed once and reused until the pose cache is built. Names that are not found in that list
+        (for example, partial DAG paths) are checked with the DCC
+        :param name: str
+        :return: bool
+        """
+
+        if self._scene_nodes is None:
+            full_names = self._client.all_scene_nodes(full_path=True) or list()
+            self._scene_nodes = set(full_names)
+            self._scene_nodes.update(self._client.all_scene_nodes(full_path=False) or list())
+            self._scene_nodes.update(full_name.rsplit('|', 1)[-1] for full_name in full_names)
+
+        return name in self._scene_nodes or self._client.node_exists(name)
+
     def _before_load(self, clear_selection=True):
         """
         Internal function that is called before loading the pose
@@ -428,6 +574,7 @@ class Pose(transfer.MayaDataTransferObject):
         logger.debug('After Load Pose "{}"'.format(self.path))
 
         self._is_loading = False
+        self._objects_cache = None
         if self._selection:
             dcc.select_node(self._selection)
             self._selection = None
@@ -11,8 +11,34 @@ from tpDcc.dccs.maya.core import namespace, reference
 
 from tpDcc.libs.datalibrary.core import transfer
 
+# DCC version does not change during the session, so it is only retrieved once
+_DCC_VERSION = None
+
+
+def get_dcc_version():
+    """
+    Returns the version of the current DCC
+    :return: str
+    """
+
+    global _DCC_VERSION
+
+    if _DCC_VERSION is None:
+        _DCC_VERSION = dcc.get_version()
+
+    return _DCC_VERSION
+
 
 class MayaDataTransferObject(transfer.BaseDataTransferObject):
+    def __init__(self):
+        super(MayaDataTransferObject, self).__init__()
+
+        # DCC client is resolved once per transfer object instead of once per node/attribute
+        self._client = dcc.client()
+
+        # Namespace of each object name. A name always maps to the same namespace, so entries stay valid when
+        # objects change
+        self._namespace_cache = dict()
 
     # =================================================================================================================
     # OVERRIDES
@@ -45,7 +71,7 @@ class MayaDataTransferObject(transfer.BaseDataTransferObject):
         references = reference.get_reference_data(list(self.objects().keys()))
 
         self.set_metadata('references', references)
-        self.set_metadata('maya_version', dcc.get_version())
+        self.set_metadata('maya_version', get_dcc_version())
         self.set_metadata('maya_scene_file', dcc.scene_name())
 
     # =================================================================================================================
@@ -60,12 +86,14 @@ class MayaDataTransferObject(transfer.BaseDataTransferObject):
 
         if self._namespaces is None:
             group_namespaces = dict()
+            namespace_cache = self._namespace_cache
             for name in self.objects():
-                node_namespace = namespace.get_namespace(name)
+                node_namespace = namespace_cache.get(name, None)
+                if node_namespace is None:
+                    node_namespace = namespace_cache[name] = namespace.get_namespace(name) or ''
                 if not node_namespace:
                     continue
-                group_namespaces.setdefault(dcc.node_short_name(name), list())
-                group_namespaces[node_namespace].append(name)
+                group_namespaces.setdefault(node_namespace, list()).append(name)
             self._namespaces = list(group_namespaces.keys())
 
         return self._namespaces
@@ -8,6 +8,13 @@ Module that contains utils functions used by data library in Maya
 from __future__ import print_function, division, absolute_import
 
 import logging
+from collections import OrderedDict, defaultdict
+
+try:
+    from sys import intern
+except ImportError:
+    # Python 2 has intern as a builtin
+    pass
 
 from tpDcc import dcc
 from tpDcc.libs.python import python
@@ -16,28 +23,111 @@ from tpDcc.libs.datalibrary.core import consts, exceptions
 
 logger = logging.getLogger(consts.LIB_ID)
 
+# Attribute types shared by all Attribute instances, keyed by node and attribute names
+_ATTRIBUTE_TYPES = dict()
+
+# Maya scene callbacks that invalidate the shared attribute types. None until they are registered
+_SCENE_CALLBACKS = None
+
+_CLIENT = None
+
+
+def _get_client():
+    """
+    Internal function that returns the DCC client. Client does not change during the session, so it is only
+    resolved once
+    :return: DccClient
+    """
+
+    global _CLIENT
+
+    if _CLIENT is None:
+        _CLIENT = dcc.client()
+
+    return _CLIENT
+
+
+def _register_scene_callbacks():
+    """
+    Internal function that registers the Maya scene callbacks that invalidate shared attribute types when the scene
+    changes. Callbacks are only registered once
+    """
+
+    global _SCENE_CALLBACKS
+
+    if _SCENE_CALLBACKS is not None:
+        return
+    _SCENE_CALLBACKS = list()
+
+    try:
+        from maya.api import OpenMaya
+    except ImportError:
+        return
+
+    for message in (
+            OpenMaya.MSceneMessage.kAfterNew, OpenMaya.MSceneMessage.kAfterOpen,
+            OpenMaya.MSceneMessage.kAfterImport, OpenMaya.MSceneMessage.kAfterLoadReference,
+            OpenMaya.MSceneMessage.kAfterUnloadReference, OpenMaya.MSceneMessage.kAfterRemoveReference):
+        _SCENE_CALLBACKS.append(
+            OpenMaya.MSceneMessage.addCallback(message, lambda *args: invalidate_attribute_cache()))
+
+
+def _set_value(name, attr, value, clamp):
+    dcc.set_attribute_value(name, attr, value, clamp=clamp)
+
+
+def _set_string_value(name, attr, value, clamp):
+    dcc.set_attribute_value(name, attr, value)
+
+
+def _set_compound_value(name, attr, value, clamp):
+    dcc.set_attribute_value(name, attr, *value)
+
+
+# Functions used to set the value of an attribute depending on its type. Other types use _set_value
+_VALUE_SETTERS = {
+    'string': _set_string_value,
+    'list': _set_compound_value,
+    'matrix': _set_compound_value
+}
+
+
+if hasattr(str, 'isascii'):
+    def _is_ascii(text):
+        # Python strings already know whether they are ASCII, so no encoded copy is created
+        return text.isascii()
+else:
+    def _is_ascii(text):
+        try:
+            text.encode('ascii')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            return False
+        return True
+
 
 class Node(object):
 
+    # Nodes are created for every matched scene object, so we avoid per-instance dictionaries
+    __slots__ = ('_name', '_short_name', '_namespace', '_mirror_axis', '_attributes')
+
     @classmethod
     def ls(cls, objects=None, selection=False):
         if objects is None and not selection:
-            objects = dcc.client().all_scene_nodes(full_path=False)
+            objects = _get_client().all_scene_nodes(full_path=False)
         else:
             objects = objects or list()
             if selection:
-                objects.extend(dcc.client().selected_nodes(full_path=False) or [])
+                objects.extend(_get_client().selected_nodes(full_path=False) or [])
 
         return [cls(name) for name in objects]
 
     def __init__(self, name, attributes=None):
-        try:
-            self._name = name.encode('ascii')
-        except Exception:
+        if not _is_ascii(name):
             raise Exception('Not a valid ASCII name "{}".'.format(name))
+        self._name = name
 
-        self._short_name = None
-        self._namespace = None
+        # Short name and namespace are computed once, as they are queried for every node while matching names
+        self._update_name_parts()
         self._mirror_axis = None
         self._attributes = attributes
 
@@ -45,21 +135,16 @@ class Node(object):
         return self.name()
 
     def name(self):
-        try:
-            return self._name.decode()
-        except AttributeError:
-            return self._name
+        return self._name
 
     def attributes(self):
         return self._attributes
 
     def short_name(self):
-        if self._short_name is None:
-            self._short_name = self.name().split('|')[-1]
-        return str(self._short_name)
+        return self._short_name
 
     def to_short_name(self):
-        names = dcc.client().list_nodes(node_name=self.short_name(), full_path=False) or list()
+        names = _get_client().list_nodes(node_name=self.short_name(), full_path=False) or list()
         if len(names) == 1:
             return Node(names[0])
         elif len(names) > 1:
@@ -68,8 +153,6 @@ class Node(object):
             raise exceptions.NoObjectFoundError('No object found {}'.format(self.short_name()))
 
     def namespace(self):
-        if self._namespace is None:
-            self._namespace = ':'.join(self.short_name().split(':')[:-1])
         return self._namespace
 
     def strip_first_pipe(self):
@@ -77,13 +160,13 @@ class Node(object):
             self._name = self.name()[1:]
 
     def exists(self):
-        return dcc.client().node_exists(self.name())
+        return _get_client().node_exists(self.name())
 
     def is_long(self):
         return '|' in self.name()
 
     def is_referenced(self):
-        return dcc.client().node_is_referenced(self.name())
+        return _get_client().node_is_referenced(self.name())
 
     def set_mirror_axis(self, mirror_axis):
         """
@@ -99,44 +182,51 @@ class Node(object):
         :param namespace: str
         """
 
-        new_name = self.name()
-        old_name = self.name()
+        old_name = self._name
 
         new_namespace = namespace
-        old_namespace = self.namespace()
+        old_namespace = self._namespace
 
         if new_namespace == old_namespace:
-            return self.name()
+            return old_name
 
-        if old_namespace and new_namespace:
-            new_name = old_name.replace(old_namespace + ":", new_namespace + ":")
-        elif old_namespace and not new_namespace:
-            new_name = old_name.replace(old_namespace + ":", "")
-        elif not old_namespace and new_namespace:
-            new_name = old_name.replace("|", "|" + new_namespace + ":")
-            if new_namespace and not new_name.startswith("|"):
-                new_name = new_namespace + ":" + new_name
+        # Namespaces can only be found at the start of each path segment, so only segment prefixes are replaced
+        old_prefix = old_namespace + ':' if old_namespace else ''
+        new_prefix = new_namespace + ':' if new_namespace else ''
+        old_prefix_length = len(old_prefix)
+        new_name = '|'.join([
+            new_prefix + part[old_prefix_length:] if part and part.startswith(old_prefix) else part
+            for part in old_name.split('|')])
 
         self._name = new_name
+        self._update_name_parts()
 
-        self._short_name = None
-        self._namespace = None
+        return new_name
 
-        return self.name()
+    def _update_name_parts(self):
+        """
+        Internal function that updates the short name and namespace from the current node name
+        """
+
+        # Few namespaces are shared by many nodes, so namespaces are interned to share a single string between them
+        self._short_name = str(self._name.rpartition('|')[2])
+        self._namespace = intern(self._short_name.rpartition(':')[0])
 
 
 class Attribute(object):
+
+    __slots__ = ('_name', '_attr', '_type', '_value', '_cache', '_full_name')
+
     def __init__(self, name, attr=None, value=None, type=None, cache=True):
         if '.' in name:
             name, attr = name.split('.')
         if attr is None:
             raise AttributeError('Cannot initialize attribute instance without a given attribute.')
 
-        try:
-            self._name = name.encode('ascii')
-            self._attr = attr.encode('ascii')
-        except UnicodeEncodeError:
-            raise UnicodeEncodeError('Not a valid ASCII name "{}.{}"'.format(name, attr))
+        if not _is_ascii(name) or not _is_ascii(attr):
+            raise UnicodeError('Not a valid ASCII name "{}.{}"'.format(name, attr))
+        self._name = name
+        self._attr = attr
 
         self._type = type
         self._value = value
@@ -188,13 +278,21 @@ class Attribute(object):
         """
 
         if self._type is None:
-            try:
-                if dcc.client().attribute_exists(self.name, self.attr):
-                    self._type = dcc.client().get_attribute_type(self.name, self.attr)
-                    if self._type:
-                        self._type = self._type.encode('ascii')
-            except Exception:
-                logger.exception('Cannot get attribute type for "{}'.format(self.fullname))
+            type_key = (self.name, self.attr)
+            if self._cache:
+                self._type = _ATTRIBUTE_TYPES.get(type_key, None)
+            if self._type is None:
+                try:
+                    client = _get_client()
+                    if client.attribute_exists(self.name, self.attr):
+                        self._type = client.get_attribute_type(self.name, self.attr)
+                        if self._type:
+                            # Native str, so type compares equal to the str keys used to dispatch setters
+                            self._type = str(self._type)
+                            _register_scene_callbacks()
+                            _ATTRIBUTE_TYPES[type_key] = self._type
+                except Exception:
+                    logger.exception('Cannot get attribute type for "{}'.format(self.fullname))
 
         return self._type
 
@@ -202,7 +300,7 @@ class Attribute(object):
     def value(self):
         if self._value is None or not self._cache:
             try:
-                self._value = dcc.client().get_attribute_value(self.name, self.attr)
+                self._value = _get_client().get_attribute_value(self.name, self.attr)
             except Exception:
                 logger.exception('Cannot get attribute value for "{}'.format(self.fullname))
 
@@ -240,7 +338,7 @@ class Attribute(object):
         :return: bool
         """
 
-        return self.type in dcc.client().get_valid_attribute_types()
+        return self.type in _get_client().get_valid_attribute_types()
 
     def is_locked(self):
         """
@@ -248,7 +346,7 @@ class Attribute(object):
         :return: bool
         """
 
-        return dcc.client().is_attribute_locked(self.name, self.attr)
+        return _get_client().is_attribute_locked(self.name, self.attr)
 
     def is_unlocked(self):
         """
@@ -305,6 +403,9 @@ class Attribute(object):
 
         connection = dcc.list_connections(self.name, self.attr, destination=False)
         if connection:
+            # Connected attributes are only settable through valid connections, no need to query the node type
+            if not valid_connections:
+                return False
             connection_type = dcc.node_type(connection)
             for valid_type in valid_connections:
                 if connection_type.startswith(valid_type):
@@ -323,29 +424,32 @@ class Attribute(object):
         :param additive: bool
         """
 
+        attr_type = self.type
+        set_value = True
+
+        # When fully blending a non additive value, the current value is not needed
         try:
-            if additive and self.type != 'bool':
+            if additive and attr_type != 'bool':
                 if self.attr.startswith('scale'):
                     value = self.value * (1 + (value - 1) * (blend / 100.0))
                 else:
                     value = self.value + value * (blend / 100.0)
             elif int(blend) == 0:
-                value = self.value
-            else:
-                value = (value - self.value) * (blend / 100.0)
-                value = self.value + value
+                # Attribute keeps its current value, so it only needs to be read if it has to be keyed
+                if key:
+                    value = self.value
+                set_value = False
+            elif blend != 100:
+                current_value = self.value
+                value = current_value + (value - current_value) * (blend / 100.0)
         except TypeError as exc:
             logger.warning('Cannot blend or add attribute "{}" | {}'.format(self.fullname, exc))
 
-        try:
-            if self.type in ['string']:
-                dcc.set_attribute_value(self.name, self.attr, value)
-            elif self.type in ['list', 'matrix']:
-                dcc.set_attribute_value(self.name, self.attr, *value)
-            else:
-                dcc.set_attribute_value(self.name, self.attr, value, clamp=clamp)
-        except (ValueError, RuntimeError) as exc:
-            logger.warning('Cannot set attribute "{}" | {}'.format(self.fullname, exc))
+        if set_value:
+            try:
+                _VALUE_SETTERS.get(attr_type, _set_value)(self.name, self.attr, value, clamp)
+            except (ValueError, RuntimeError) as exc:
+                logger.warning('Cannot set attribute "{}" | {}'.format(self.fullname, exc))
 
         try:
             if key:
@@ -383,22 +487,40 @@ class Attribute(object):
 
         self._type = None
         self._value = None
+        _ATTRIBUTE_TYPES.pop((self.name, self.attr), None)
+
+
+def invalidate_attribute_cache(names=None):
+    """
+    Removes the attribute types shared between Attribute instances
+    :param names: list(str) or None, node names whose attribute types are removed. If None, all of them are removed
+    """
+
+    if names is None:
+        _ATTRIBUTE_TYPES.clear()
+        return
+
+    names = set(python.force_list(names))
+    for type_key in [type_key for type_key in _ATTRIBUTE_TYPES if type_key[0] in names]:
+        del _ATTRIBUTE_TYPES[type_key]
 
 
-def group_objects(objects):
+def group_objects(objects, nodes=None):
     """
     Group objects as Nodes
     :param objects: list(str)
+    :param nodes: dict or None, if given, created nodes are stored on it by name so they can be reused
     :return: dict
     """
 
-    results = dict()
+    results = defaultdict(list)
     for name in objects:
         node = Node(name)
-        results.setdefault(node.namespace(), list())
+        if nodes is not None:
+            nodes[name] = node
         results[node.namespace()].append(name)
 
-    return results
+    return dict(results)
 
 
 def get_reference_paths(objects, without_copy_number=False):
@@ -409,12 +531,15 @@ def get_reference_paths(objects, without_copy_number=False):
     :return: list(str)
     """
 
-    paths = list()
-    for obj in objects:
-        if dcc.client().node_is_referenced(obj):
-            paths.append(dcc.client().node_reference_path(obj, without_copy_number=without_copy_number))
+    client = _get_client()
+    node_is_referenced = client.node_is_referenced
+    node_reference_path = client.node_reference_path
 
-    return list(set(paths))
+    paths = [
+        node_reference_path(obj, without_copy_number=without_copy_number) for obj in objects if node_is_referenced(obj)]
+
+    # Duplicated paths are removed keeping the order in which they are found
+    return list(OrderedDict.fromkeys(paths))
 
 
 def get_reference_data(objects):
@@ -424,15 +549,16 @@ def get_reference_data(objects):
     :return: list(dict)
     """
 
-    data = list()
+    client = _get_client()
     paths = get_reference_paths(objects)
-    for path in paths:
-        data.append({
+    data = [
+        {
             'filename': path,
-            'unresolved': dcc.client().node_reference_path(path, without_copy_number=True),
-            'namespace': dcc.client().node_namespace(path),
-            'node': dcc.client().node_is_referenced(path)
-        })
+            'unresolved': client.node_reference_path(path, without_copy_number=True),
+            'namespace': client.node_namespace(path),
+            'node': client.node_is_referenced(path)
+        } for path in paths
+    ]
 
     return data
 
@@ -443,14 +569,13 @@ def index_objects(objects):
     :return: dict
     """
 
-    result = dict()
+    result = defaultdict(list)
     if objects:
         for name in objects:
             node = Node(name)
-            result.setdefault(node.short_name(), list())
             result[node.short_name()].append(node)
 
-    return result
+    return dict(result)
 
 
 def match_in_index(node, index):
@@ -460,43 +585,52 @@ def match_in_index(node, index):
     :return: Node
     """
 
-    result = None
-    if node.short_name() in index:
-        nodes = index[node.short_name()]
-        if nodes:
-            for node_found in nodes:
-                if node.name().endswith(node_found.name()) or node_found.name().endswith(node.name()):
-                    result = node_found
-                    break
-            if result is not None:
-                index[node.short_name()].remove(result)
+    nodes = index.get(node.short_name(), None)
+    if not nodes:
+        return None
+
+    # A name can only end with names that are not longer than itself, so only one of the checks is needed
+    name = node.name()
+    name_length = len(name)
+    for i, node_found in enumerate(nodes):
+        found_name = node_found.name()
+        if len(found_name) <= name_length:
+            is_match = name.endswith(found_name)
+        else:
+            is_match = found_name.endswith(name)
+        if is_match:
+            del nodes[i]
+            return node_found
 
-    return result
+    return None
 
 
-def match_names(source_objects, target_objects=None, target_namespaces=None, search=None, replace=None):
+def match_names(
+        source_objects, target_objects=None, target_namespaces=None, search=None, replace=None, transform=None):
     """
     :param source_objects: list(str)
     :param target_objects: list(str)
     :param target_namespaces: list(str)
     :param search: str
     :param replace: str
-    :return: list(Node, Node)
+    :param transform: callable or None, function applied to source names to get target names. If given, search and
+        replace are ignored
+    :return: generator(tuple(Node, Node)), matches are yielded as soon as they are found
     """
 
     # To avoid cyclic ipmorts
     from tpDcc.libs.datalibrary.dccs.maya.core import mirrortable
 
-    def _rotate_sequence(sequence, current):
-        n = len(sequence)
-        for num in range(n):
-            yield sequence[(num + current) % n]
+    if transform is None and search is not None and replace is not None:
+        transform = mirrortable.MayaMirrorTable.replacer(search, replace)
 
-    results = list()
     target_objects = python.force_list(target_objects)
     target_namespaces = python.force_list(target_namespaces)
 
-    source_group = group_objects(source_objects)
+    # Source nodes are never modified, so the ones created while grouping are reused for all the matches.
+    # Target nodes are modified (namespace, pipes) so a new one is always created
+    source_nodes = dict()
+    source_group = group_objects(source_objects, nodes=source_nodes)
     source_namespaces = source_group.keys()
 
     if not target_objects and not target_namespaces:
@@ -506,8 +640,17 @@ def match_names(source_objects, target_objects=None, target_namespaces=None, sea
         target_namespaces = target_group.keys()
 
     target_index = index_objects(target_objects)
-    target_namespaces2 = list(set(target_namespaces) - set(source_namespaces))      # Target ns not in source objects
-    target_namespaces1 = list(set(target_namespaces) - set(target_namespaces2))     # Target ns in source objects
+
+    # Target namespaces are split in a single pass into the ones used by source objects and the other ones
+    target_namespaces1 = set()      # Target ns in source objects
+    target_namespaces2 = list()     # Target ns not in source objects
+    other_namespaces = set()
+    for target_namespace in target_namespaces:
+        if target_namespace in source_group:
+            target_namespaces1.add(target_namespace)
+        elif target_namespace not in other_namespaces:
+            other_namespaces.add(target_namespace)
+            target_namespaces2.append(target_namespace)
 
     used_namespaces = list()
     not_used_namespaces = list()
@@ -517,14 +660,13 @@ def match_names(source_objects, target_objects=None, target_namespaces=None, sea
         if source_namespace in target_namespaces1:
             used_namespaces.append(source_namespace)
             for name in source_group[source_namespace]:
-                source_node = Node(name)
-                if search is not None and replace is not None:
-                    name = mirrortable.MayaMirrorTable.replace(name, search, replace)
+                source_node = source_nodes[name]
+                if transform is not None:
+                    name = transform(name)
                 target_node = Node(name)
                 if target_objects:
                     target_node = match_in_index(target_node, target_index)
                 if target_node:
-                    results.append((source_node, target_node))
                     yield (source_node, target_node)
                 else:
                     logger.debug('Cannot find matching target object for "{}"'.format(source_node.name()))
@@ -538,13 +680,14 @@ def match_names(source_objects, target_objects=None, target_namespaces=None, sea
     for target_namespace in target_namespaces2:
         match = False
         i = index
-        for source_namespace in _rotate_sequence(source_namespaces, index):
+        start = index % len(source_namespaces) if source_namespaces else 0
+        for source_namespace in source_namespaces[start:] + source_namespaces[:start]:
             if match:
                 index = i
                 break
             i += 1
             for name in source_group[source_namespace]:
-                source_node = Node(name)
+                source_node = source_nodes[name]
                 target_node = Node(name)
                 target_node.set_namespace(target_namespace)
                 if target_objects:
@@ -552,7 +695,6 @@ def match_names(source_objects, target_objects=None, target_namespaces=None, sea
 
                 if target_node:
                     match = True
-                    results.append((source_node, target_node))
                     yield (source_node, target_node)
                 else:
                     logger.debug('Cannot find matching target object for "{}"'.format(source_node.name()))
@@ -8,17 +8,81 @@ Module that contains curve data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
-import json
+import sys
+import array
+import base64
 import logging
 
 from tpDcc import dcc
 from tpDcc.core import dcc as core_dcc
 
-from tpDcc.libs.datalibrary.core import consts, datapart
+from tpDcc.libs.datalibrary.core import consts, datapart, utils
 
 LOGGER = logging.getLogger(consts.LIB_ID)
 
+_SUPPORTED_DCCS = (core_dcc.Dccs.Maya,)
+
+# Version of the curve data written by save. Version 1 (no format_version key) stores knots and CVs as plain lists,
+# version 2 stores them packed
+FORMAT_VERSION = 2
+
+
+def _pack_values(values):
+    """
+    Internal function that packs given float values into a base64 string of little endian doubles
+    :param values: list(float)
+    :return: str
+    """
+
+    values = array.array('d', values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    data = values.tobytes() if hasattr(values, 'tobytes') else values.tostring()
+
+    return base64.b64encode(data).decode('ascii')
+
+
+def _unpack_values(data):
+    """
+    Internal function that unpacks the values packed with _pack_values function
+    :param data: str
+    :return: array.array
+    """
+
+    values = array.array('d')
+    data = base64.b64decode(data)
+    if hasattr(values, 'frombytes'):
+        values.frombytes(data)
+    else:
+        values.fromstring(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values
+
+
+def _pack_points(points):
+    """
+    Internal function that packs given points into a base64 string of little endian doubles
+    :param points: list(list(float))
+    :return: str
+    """
+
+    return _pack_values([value for point in points for value in point])
+
+
+def _unpack_points(data, dimension):
+    """
+    Internal function that unpacks the points packed with _pack_points function
+    :param data: str
+    :param dimension: int, number of components of each point
+    :return: list(tuple(float))
+    """
+
+    values = _unpack_values(data)
+
+    return [tuple(values[i:i + dimension]) for i in range(0, len(values), dimension)]
+
 
 class MayaCurveData(datapart.DataPart):
 
@@ -28,11 +92,9 @@ class MayaCurveData(datapart.DataPart):
     PRIORITY = 11
     EXTENSION = '.curve'
 
-    _has_trait = re.compile(r'\.curve$', re.I)
-
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if MayaCurveData._has_trait.search(identifier):
+        if identifier[-len(MayaCurveData.EXTENSION):].lower() == MayaCurveData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -42,10 +104,10 @@ class MayaCurveData(datapart.DataPart):
 
     @classmethod
     def supported_dccs(cls):
-        return [core_dcc.Dccs.Maya]
+        return _SUPPORTED_DCCS
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def icon(self):
         return 'circle'
@@ -89,31 +151,32 @@ class MayaCurveData(datapart.DataPart):
 
     def save(self, **kwargs):
         filepath = self.format_identifier()
-        if not filepath.endswith(MayaCurveData.EXTENSION):
-            filepath = '{}{}'.format(filepath, MayaCurveData.EXTENSION)
-
         if not filepath:
             LOGGER.warning('Impossible to save curve data file because save file path not defined!')
             return
 
+        client = dcc.client()
         objects = kwargs.get('objects', None)
         if not objects:
-            objects = dcc.client().selected_nodes(full_path=True)
+            objects = client.selected_nodes(full_path=True)
         if not objects:
             LOGGER.warning(
                 'Nothing selected to export curve data of. Please, select a curve to export')
             return False
 
-        LOGGER.debug('Saving {} | {}'.format(filepath, kwargs))
+        LOGGER.debug('Saving %s | %s', filepath, kwargs)
 
         valid_nodes = list()
+        visited_nodes = set()
 
         for obj in objects:
-            if dcc.client().node_is_a_shape(obj):
-                obj = dcc.client().node_parent(obj, full_path=True)
-            if not dcc.client().node_is_curve(obj):
+            if client.node_is_a_shape(obj):
+                obj = client.node_parent(obj, full_path=True)
+            if obj in visited_nodes:
                 continue
-            valid_nodes.append(obj)
+            visited_nodes.add(obj)
+            if client.node_is_curve(obj):
+                valid_nodes.append(obj)
 
         if not valid_nodes:
             LOGGER.warning('Curve data export failed! No curves to export found!')
@@ -122,22 +185,25 @@ class MayaCurveData(datapart.DataPart):
         world_space = kwargs.pop('world_space', False)
         curve_data = dict()
 
-        for curve in objects:
-            curve_degree = dcc.client().get_curve_degree(curve)
-            curve_form = dcc.client().get_curve_form(curve)
+        for curve in valid_nodes:
+            curve_degree = client.get_curve_degree(curve)
+            curve_form = client.get_curve_form(curve)
 
             # We need to do this because we return the form using maya.cmds but we expect to use
             # it using OpenMaya, and the form index in OpenMaya starts with 1 instead of 0
             curve_form += 1
 
-            curve_knots = dcc.client().get_curve_knots(curve)
-            curve_cvs = dcc.client().get_curve_cvs(curve, world_space=world_space)
+            curve_knots = client.get_curve_knots(curve)
+            curve_cvs = client.get_curve_cvs(curve, world_space=world_space)
 
+            # Knots and CVs are stored packed, so their floats are not converted from/to text when writing/reading
             curve_data[curve] = {
+                'format_version': FORMAT_VERSION,
                 'degree': curve_degree,
                 'form': curve_form,
-                'knots': curve_knots,
-                'cvs': curve_cvs,
+                'knots_packed': _pack_values(curve_knots),
+                'cvs_packed': _pack_points(curve_cvs),
+                'cvs_dimension': len(curve_cvs[0]) if curve_cvs else 3,
                 '2d': False,
                 'rational': True
             }
@@ -145,32 +211,38 @@ class MayaCurveData(datapart.DataPart):
             LOGGER.warning('Curve data export failed! No curve data found for given curves!')
             return False
 
-        with open(filepath, 'w') as fh:
-            json.dump(curve_data, fh)
+        with open(filepath, 'wb') as fh:
+            fh.write(utils.json_dumps(curve_data))
 
-        LOGGER.debug('Saved {} successfully!'.format(filepath))
+        LOGGER.debug('Saved %s successfully!', filepath)
 
         return True
 
     def import_data(self, *args, **kwargs):
         filepath = self.format_identifier()
-        if not filepath.endswith(MayaCurveData.EXTENSION):
-            filepath = '{}{}'.format(filepath, MayaCurveData.EXTENSION)
-
         if not filepath:
             LOGGER.warning('Impossible to load Maya Curves from file: "{}"!'.format(filepath))
             return False
 
-        with open(filepath, 'r') as fh:
-            curves_data = json.load(fh)
+        with open(filepath, 'rb') as fh:
+            curves_data = utils.json_load_file(fh)
         if not curves_data:
             LOGGER.warning('No curves data found in file: "{}"'.format(filepath))
             return False
 
+        client = dcc.client()
         created_curves = list()
 
         for curve_name, curve_data in curves_data.items():
-            new_curve = dcc.client().create_curve(curve_name, **curve_data)
+            format_version = curve_data.pop('format_version', 1)
+            if format_version > FORMAT_VERSION:
+                LOGGER.warning('Skipping curve "{}": unsupported curve data format version {}'.format(
+                    curve_name, format_version))
+                continue
+            if format_version >= 2:
+                curve_data['knots'] = list(_unpack_values(curve_data.pop('knots_packed')))
+                curve_data['cvs'] = _unpack_points(curve_data.pop('cvs_packed'), curve_data.pop('cvs_dimension', 3))
+            new_curve = client.create_curve(curve_name, **curve_data)
             created_curves.append(new_curve)
 
         return created_curves
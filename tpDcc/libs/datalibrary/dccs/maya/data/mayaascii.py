@@ -8,22 +8,90 @@ Module that contains Maya ascii data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
+import mmap
 import stat
-import shutil
+import time
 import logging
+from contextlib import closing
 
 from tpDcc import dcc
 from tpDcc.core import dcc as core_dcc
 
 from tpDcc.libs.datalibrary.core import consts, datapart
 
-# NOTE: only import specific DCCs module if we inside Maya
-if dcc.is_maya():
-    import maya.cmds
-
 logger = logging.getLogger(consts.LIB_ID)
 
+_SUPPORTED_DCCS = (core_dcc.Dccs.Maya,)
+
+# Scene namespaces are cached during this amount of seconds, so schema requests from UI refreshes do not walk the scene
+NAMESPACES_CACHE_TIME = 1.0
+_NAMESPACES_CACHE = {'time': 0.0, 'namespaces': None}
+
+# Buffer size used when rewriting Maya ASCII files
+FILE_BUFFER_SIZE = 1 << 20
+
+
+def _replace_file(source_path, target_path):
+    """
+    Internal function that moves source file into target path, overwriting it if it already exists
+    :param source_path: str
+    :param target_path: str
+    """
+
+    replace = getattr(os, 'replace', None)
+    if replace is not None:
+        replace(source_path, target_path)
+        return
+
+    # Python 2 os.rename does not overwrite existing files in Windows
+    if os.name == 'nt' and os.path.isfile(target_path):
+        os.remove(target_path)
+    os.rename(source_path, target_path)
+
+
+def _student_line_spans(buffer):
+    """
+    Internal function that returns the byte ranges of the student license lines of the given Maya ASCII file contents.
+    Only the header (the contents before the first createNode) is scanned
+    :param buffer: bytes or mmap.mmap
+    :return: list(tuple(int, int)), list of (line start, line end) ranges. Line end includes the line break
+    """
+
+    header_end = buffer.find(b'createNode')
+    if header_end == -1:
+        header_end = len(buffer)
+
+    # Clean files are discarded with a single search. Otherwise, scan starts at the line of the first student match
+    student_index = buffer.find(b'student', 0, header_end)
+    if student_index == -1:
+        return list()
+
+    spans = list()
+    index = buffer.find(b'fileInfo', buffer.rfind(b'\n', 0, student_index) + 1, header_end)
+    while index != -1:
+        line_start = buffer.rfind(b'\n', 0, index) + 1
+        line_end = buffer.find(b'\n', index)
+        line_end = len(buffer) if line_end == -1 else line_end + 1
+        if buffer.find(b'student', line_start, line_end) != -1:
+            spans.append((line_start, line_end))
+        index = buffer.find(b'fileInfo', line_end, header_end)
+
+    return spans
+
+
+def _list_namespaces():
+    """
+    Internal function that returns current scene namespaces
+    :return: list(str)
+    """
+
+    now = time.time()
+    if _NAMESPACES_CACHE['namespaces'] is None or now - _NAMESPACES_CACHE['time'] > NAMESPACES_CACHE_TIME:
+        _NAMESPACES_CACHE['namespaces'] = dcc.client().list_namespaces()
+        _NAMESPACES_CACHE['time'] = now
+
+    return _NAMESPACES_CACHE['namespaces']
+
 
 class MayaAsciiData(datapart.DataPart):
 
@@ -33,11 +101,9 @@ class MayaAsciiData(datapart.DataPart):
     PRIORITY = 10
     EXTENSION = '.ma'
 
-    _has_trait = re.compile(r'\.ma$', re.I)
-
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if MayaAsciiData._has_trait.search(identifier):
+        if identifier[-len(MayaAsciiData.EXTENSION):].lower() == MayaAsciiData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -47,7 +113,7 @@ class MayaAsciiData(datapart.DataPart):
 
     @classmethod
     def supported_dccs(cls):
-        return [core_dcc.Dccs.Maya]
+        return _SUPPORTED_DCCS
 
     @classmethod
     def metadata_dict(cls):
@@ -61,7 +127,7 @@ class MayaAsciiData(datapart.DataPart):
         }
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def icon(self):
         return 'maya'
@@ -98,7 +164,7 @@ class MayaAsciiData(datapart.DataPart):
                 'title': '',
                 'type': 'tags',
                 'value': [],
-                'items': dcc.client().list_namespaces(),
+                'items': _list_namespaces(),
                 'persistent': True,
                 'label': {'visible': False},
                 'persistentKey': 'MayaAsciiData'
@@ -191,7 +257,10 @@ class MayaAsciiData(datapart.DataPart):
             logger.warning('Impossible to save Maya ASCII file because save file path not defined!')
             return
 
-        logger.debug('Saving {} | {}'.format(filepath, kwargs))
+        # NOTE: Maya module is only imported when saving, so data types catalog scans do not pay for it
+        import maya.cmds
+
+        logger.debug('Saving %s | %s', filepath, kwargs)
 
         maya_type = 'mayaBinary' if filepath.endswith('.mb') else 'mayaAscii'
 
@@ -203,7 +272,7 @@ class MayaAsciiData(datapart.DataPart):
         maya.cmds.file(rename=filepath)
         result = maya.cmds.file(type=maya_type, options='v=0;', preserveReferences=True, save=True)
 
-        logger.debug('Saved {} successfully!'.format(filepath))
+        logger.debug('Saved %s successfully!', filepath)
 
         return result
 
@@ -217,52 +286,51 @@ class MayaAsciiData(datapart.DataPart):
             logger.info('Maya Binary files cannot be cleaned!')
             return False
 
-        changed = False
-
         if file_path.endswith('.mb'):
             logger.warning('Student License Check is not supported in binary files!')
             return True
 
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-
-        has_student_license = False
-        for line in lines:
-            if 'createNode' in line:
-                break
-            if 'fileInfo' in line and 'student' in line:
-                has_student_license = True
-                break
-        if not has_student_license:
+        file_size = os.path.getsize(file_path)
+        if not file_size:
             logger.info('File is already cleaned: no student line found!')
             return False
 
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-        step = len(lines) / 4
-
         no_student_filename = file_path[:-3] + '.no_student.ma'
-        with open(no_student_filename, 'w') as f:
-            step_count = 0
-            for line in lines:
-                step_count += 1
-                if 'fileInfo' in line:
-                    if 'student' in line:
-                        changed = True
-                        continue
-                f.write(line)
-                if step_count > step:
-                    logger.debug('Updating File: {}% ...'.format(100 / (len(lines) / step_count)))
-                    step += step
-
-        if changed:
+        with open(file_path, 'rb') as f:
+            with closing(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)) as mm:
+                spans = _student_line_spans(mm)
+                if not spans:
+                    logger.info('File is already cleaned: no student line found!')
+                    return False
+
+                # File contents are copied in chunks around the student lines, so the file is never fully loaded
+                report_every = max(1, file_size // 4)
+                next_report = report_every
+                log_progress = logger.isEnabledFor(logging.DEBUG)
+                with open(no_student_filename, 'wb') as out:
+                    for start, end in zip([0] + [span[1] for span in spans], [span[0] for span in spans] + [file_size]):
+                        for chunk_start in range(start, end, FILE_BUFFER_SIZE):
+                            chunk_end = min(chunk_start + FILE_BUFFER_SIZE, end)
+                            out.write(mm[chunk_start:chunk_end])
+                            if chunk_end >= next_report:
+                                if log_progress:
+                                    logger.debug('Updating File: %d%% ...', 100 * chunk_end // file_size)
+                                next_report = (chunk_end // report_every + 1) * report_every
+
+        # Target must be writable to be replaced (read-only files cannot be replaced in Windows). Original permissions
+        # are restored once the cleaned file replaces it
+        file_mode = stat.S_IMODE(os.stat(file_path).st_mode)
+        try:
             os.chmod(file_path, stat.S_IWUSR | stat.S_IREAD)
-            shutil.copy2(no_student_filename, file_path)
-
-            try:
-                os.remove(no_student_filename)
-            except Exception as exc:
-                logger.warning('Error while cleanup no student file process files ... >> {}'.format(exc))
-                return False
+            _replace_file(no_student_filename, file_path)
+            os.chmod(file_path, file_mode)
+        except Exception as exc:
+            logger.warning('Error while cleanup no student file process files ... >> {}'.format(exc))
+            if os.path.isfile(no_student_filename):
+                try:
+                    os.remove(no_student_filename)
+                except Exception:
+                    logger.warning('Impossible to remove temporary file: {}'.format(no_student_filename))
+            return False
 
-            logger.info('Cleaned student license from file: {}'.format(file_path))
+        logger.info('Cleaned student license from file: %s', file_path)
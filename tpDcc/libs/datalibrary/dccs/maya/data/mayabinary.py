@@ -8,12 +8,13 @@ Module that contains Maya binary data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
 
 from tpDcc import dcc
 from tpDcc.core import dcc as core_dcc
 from tpDcc.libs.datalibrary.core import datapart
 
+_SUPPORTED_DCCS = (core_dcc.Dccs.Maya,)
+
 
 class MayaBinaryData(datapart.DataPart):
 
@@ -23,11 +24,9 @@ class MayaBinaryData(datapart.DataPart):
     PRIORITY = 10
     EXTENSION = '.mb'
 
-    _has_trait = re.compile(r'\.mb$', re.I)
-
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if MayaBinaryData._has_trait.search(identifier):
+        if identifier[-len(MayaBinaryData.EXTENSION):].lower() == MayaBinaryData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -37,10 +36,10 @@ class MayaBinaryData(datapart.DataPart):
 
     @classmethod
     def supported_dccs(cls):
-        return [core_dcc.Dccs.Maya]
+        return _SUPPORTED_DCCS
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def icon(self):
         return 'maya'
@@ -66,9 +65,6 @@ class MayaBinaryData(datapart.DataPart):
         """
 
         filepath = self.format_identifier()
-        if not filepath.endswith(MayaBinaryData.EXTENSION):
-            filepath = '{}{}'.format(filepath, MayaBinaryData.EXTENSION)
-
         if not filepath or not os.path.isfile(filepath):
             return
 
@@ -80,9 +76,6 @@ class MayaBinaryData(datapart.DataPart):
         """
 
         filepath = self.format_identifier()
-        if not filepath.endswith(MayaBinaryData.EXTENSION):
-            filepath = '{}{}'.format(filepath, MayaBinaryData.EXTENSION)
-
         if not filepath or os.path.isfile(filepath):
             return
 
@@ -8,7 +8,6 @@ Module that contains pose data part implementation
 from __future__ import print_function, division, absolute_import
 
 import os
-import re
 import logging
 import traceback
 
@@ -18,6 +17,8 @@ from tpDcc.libs.datalibrary.core import consts, datapart
 
 logger = logging.getLogger(consts.LIB_ID)
 
+_SUPPORTED_DCCS = (core_dcc.Dccs.Maya,)
+
 
 class PoseData(datapart.DataPart):
 
@@ -27,11 +28,9 @@ class PoseData(datapart.DataPart):
     PRIORITY = 16
     EXTENSION = '.pose'
 
-    _has_trait = re.compile(r'\.pose$', re.I)
-
     @classmethod
     def can_represent(cls, identifier, only_extension=False):
-        if PoseData._has_trait.search(identifier):
+        if identifier[-len(PoseData.EXTENSION):].lower() == PoseData.EXTENSION:
             if only_extension:
                 return True
             if os.path.isfile(identifier):
@@ -41,10 +40,10 @@ class PoseData(datapart.DataPart):
 
     @classmethod
     def supported_dccs(cls):
-        return [core_dcc.Dccs.Maya]
+        return _SUPPORTED_DCCS
 
     def label(self):
-        return os.path.basename(self.identifier())
+        return self.basename()
 
     def icon(self):
         return 'pose'
@@ -68,9 +67,6 @@ class PoseData(datapart.DataPart):
         from tpDcc.libs.datalibrary.dccs.maya.core import pose
 
         filepath = self.format_identifier()
-        if not filepath.endswith(PoseData.EXTENSION):
-            filepath = '{}{}'.format(filepath, PoseData.EXTENSION)
-
         if not filepath:
             logger.warning('Impossible to save pose file because save file path not defined!')
             return
@@ -99,9 +95,6 @@ class PoseData(datapart.DataPart):
         from tpDcc.libs.datalibrary.dccs.maya.core import pose
 
         filepath = self.format_identifier()
-        if not filepath.endswith(PoseData.EXTENSION):
-            filepath = '{}{}'.format(filepath, PoseData.EXTENSION)
-
         if not filepath:
             logger.warning('Impossible to save pose file because save file path not defined!')
             return False
@@ -13,6 +13,11 @@ import locale
 import getpass
 from collections import OrderedDict
 
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+
 from tpDcc.libs.python import python, fileio, path as path_utils
 
 from tpDcc.libs.datalibrary.core import scanner
@@ -94,6 +99,10 @@ class FileScannerPlugin(scanner.BaseScanner):
         :return: list
         """
 
+        # Directory entries cache their type, so no extra stat call is needed per entry
+        if scandir is not None:
+            return [path_utils.clean_path(entry.path) for entry in scandir(location) if entry.is_dir()]
+
         folders = list()
         for folder in os.listdir(location):
             folder_path = path_utils.clean_path(os.path.join(location, folder))